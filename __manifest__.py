@@ -20,13 +20,16 @@
     'version': '16.0.1.0.0',
 
     # any module necessary for this one to work correctly
-    'depends': ['project', 'hr_timesheet', 'web', 'base','sale_management','sale_timesheet',],
+    'depends': ['project', 'hr_timesheet', 'web', 'base', 'bus','sale_management','sale_timesheet',],
 
     # always loaded
     'data': [
-        # 'security/ir.model.access.csv',
+        'security/ir.model.access.csv',
+        'security/dashboard_security.xml',
+        'data/dashboard_cron.xml',
         'views/views.xml',
-        'views/project_dashboard_views.xml'
+        'views/project_dashboard_views.xml',
+        'views/dashboard_slow_log_views.xml',
     ],
     # only loaded in demonstration mode
     'demo': [
@@ -38,7 +41,6 @@
             'project_dashboard/static/src/css/dashboard.css',
             "project_dashboard/static/src/js/dashboard.js",
             'project_dashboard/static/src/xml/dashboard_templates.xml',
-            'https://cdnjs.cloudflare.com/ajax/libs/Chart.js/3.9.1/chart.min.js',
         ],
     },
     'installable': True,
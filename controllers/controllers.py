@@ -1,105 +1,418 @@
 # -*- coding: utf-8 -*-
-from odoo import http
+import cProfile
+import functools
+import io
+import json
+import logging
+import marshal
+import os
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+
+import psycopg2
+import psycopg2.errors
+from werkzeug.exceptions import NotFound
+
+from odoo import SUPERUSER_ID, _, api, fields, http
+from odoo.exceptions import AccessError, UserError
 from odoo.http import request
-from datetime import datetime, timedelta
+from odoo.tools import consteq
 
+from odoo.addons.project_dashboard.models.dashboard_context import DashboardContext
 
-class ProjectDashboard(http.Controller):
-    @http.route('/project/dashboard/data', type='json', auth='user')
-    def get_dashboard_data(self, start_date=None, end_date=None):
-        Projects = request.env['project.project']
-        Tasks = request.env['project.task']
+from . import instrumentation
+from .instrumentation import WidgetBudgetExceeded, last_results, query_budget, widget_timings
 
-        # Convert date strings to datetime objects
-        try:
-            if start_date:
-                start_date = datetime.strptime(start_date, '%Y-%m-%d')
-            else:
-                # Default to 30 days ago if no start date provided
-                start_date = datetime.now() - timedelta(days=30)
+_logger = logging.getLogger(__name__)
 
-            if end_date:
-                end_date = datetime.strptime(end_date, '%Y-%m-%d')
-            else:
-                # Default to current date if no end date provided
-                end_date = datetime.now()
-        except ValueError:
-            # Fallback to default date range if parsing fails
-            start_date = datetime.now() - timedelta(days=30)
-            end_date = datetime.now()
-
-        # Get data within the selected period
-        domain = [
-            ('create_date', '>=', start_date),
-            ('create_date', '<=', end_date),
-            ('active', '=', True)
-        ]
 
-        active_projects = Projects.search([('active', '=', True)])
-        active_tasks = Tasks.search([])
-        team_members = active_projects.mapped('user_id')
+class ProjectDashboard(http.Controller):
+    @http.route('/project/dashboard/data', type='json', auth='user')
+    def get_dashboard_data(self, start_date=None, end_date=None, limit=None, offset=0, use_replica=True,
+                           parallel=False, with_meta=False, profile=False, widgets=None, max_points=None,
+                           interval='auto'):
+        Dashboard = request.env['project_dashboard.data']
+        start_date, end_date = Dashboard._parse_date_range(start_date, end_date)
+        limit, offset, max_points, interval = Dashboard._parse_dashboard_options(
+            start_date, end_date, limit, offset, max_points, interval)
+
+        profiler = None
+        if profile:
+            if not request.env.user.has_group('base.group_system'):
+                raise AccessError(_("Only administrators can profile the dashboard."))
+            # cProfile only follows the request thread
+            parallel = False
+            profiler = cProfile.Profile()
+
+        # Only compute the requested widgets (the client loads the charts as they scroll into view)
+        requested = widgets
+        # Users, employees, stages, projects and colors, loaded once for all the widgets
+        dashboard_context = DashboardContext()
+        widgets = Dashboard._get_dashboard_widgets(start_date, end_date, limit, offset, max_points, interval,
+                                                   dashboard_context)
+        if requested:
+            widgets = {key: compute for key, compute in widgets.items() if key in requested}
+        parallel = parallel and self._get_parallel_workers() > 1
+        options = {
+            'parallel': parallel,
+            'capture_sql': bool(profiler) or self._get_slow_widget_threshold() > 0,
+            'fallbacks': Dashboard._get_dashboard_fallbacks(start_date, end_date, max_points, dashboard_context),
+            'cache_key': (start_date.date(), end_date.date(), limit, offset, max_points, interval),
+        }
+
+        started = time.perf_counter()
+        stats = {}
+        values = None
+        if profiler:
+            profiler.enable()
+
+        # The aggregations are read-only: serve them from the replica when one is
+        # configured, and fall back to the request cursor if it is unavailable.
+        replica_cr = Dashboard._get_replica_cursor() if use_replica else None
+        if replica_cr:
+            try:
+                with closing(replica_cr):
+                    env = api.Environment(replica_cr, request.env.uid, request.env.context)
+                    values = self._get_dashboard_values(
+                        env, widgets, cursor_factory=Dashboard._get_replica_cursor, share_snapshot=False,
+                        stats=stats, **options)
+                    values['data_source'] = 'replica'
+            except psycopg2.OperationalError:
+                _logger.warning("Dashboard replica failed, falling back to the primary database",
+                                exc_info=True)
+                values = None
+                stats.clear()
+
+        if values is None:
+            values = self._get_dashboard_values(
+                request.env, widgets, cursor_factory=request.env.registry.cursor, stats=stats, **options)
+            values['data_source'] = 'primary'
+
+        if profiler:
+            profiler.disable()
+        meta = self._record_dashboard_stats(values, stats, time.perf_counter() - started)
+        self._log_slow_widgets(stats, {
+            'start_date': start_date.date(), 'end_date': end_date.date(), 'limit': limit, 'offset': offset,
+            'data_source': values['data_source'], 'parallel': parallel, 'widgets': list(widgets),
+            'max_points': max_points, 'interval': interval,
+        })
+        if profiler:
+            meta['profile'] = self._store_profile(profiler, stats)
+        if with_meta or profiler:
+            values['_meta'] = meta
+        return values
 
-        # Calculate total hours from timesheets
-        total_hours = sum(active_tasks.mapped('effective_hours') or [0])
+    @http.route('/project/dashboard/job/submit', type='json', auth='user')
+    def submit_dashboard_job(self, start_date=None, end_date=None, limit=None, offset=0, widgets=None,
+                             max_points=None, interval='auto'):
+        """
+        Queue the computation of the dashboard data for a range too large to be
+        computed within the request, and return the id of the job. Its user is
+        notified on the bus (project_dashboard/job_done) once it is finished.
+        """
+        Dashboard = request.env['project_dashboard.data']
+        start_date, end_date = Dashboard._parse_date_range(start_date, end_date)
+        limit, offset, max_points, interval = Dashboard._parse_dashboard_options(
+            start_date, end_date, limit, offset, max_points, interval)
+        # The users cannot create jobs themselves, only submit their parameters here
+        job = request.env['project_dashboard.job'].sudo().create({
+            'user_id': request.env.uid,
+            'parameters': json.dumps({
+                'start_date': f'{start_date:%Y-%m-%d}',
+                'end_date': f'{end_date:%Y-%m-%d}',
+                'limit': limit,
+                'offset': offset,
+                'widgets': widgets,
+                'max_points': max_points,
+                'interval': interval,
+            }),
+        })
+        request.env.ref('project_dashboard.ir_cron_run_dashboard_jobs').sudo()._trigger()
+        return {'job_id': job.id}
+
+    @http.route('/project/dashboard/job/state', type='json', auth='user')
+    def get_dashboard_job_state(self, job_id):
+        job = self._get_dashboard_job(job_id)
+        return {'state': job.state, 'error': job.error}
+
+    @http.route('/project/dashboard/job/result', type='json', auth='user')
+    def get_dashboard_job_result(self, job_id):
+        """Return the dashboard data computed by a finished job, like /project/dashboard/data."""
+        job = self._get_dashboard_job(job_id)
+        if job.state != 'done':
+            raise UserError(_("The dashboard data is not computed yet."))
+        return json.loads(job.result)
+
+    @http.route('/project/dashboard/stats', type='json', auth='user')
+    def get_dashboard_stats(self):
+        """Rolling p50/p95 durations (ms) of the dashboard and of each widget in this worker."""
+        return {
+            'pid': os.getpid(),
+            'timings': widget_timings.summary(),
+        }
 
-        values = {
-            'summary': {
-                'total_projects': len(active_projects),
-                'active_tasks': len(active_tasks.filtered(lambda t: not t.stage_id.fold)),
-                'total_hours': round(total_hours, 2),
-                'team_members': len(team_members),
+    @http.route('/project/dashboard/metrics', type='http', auth='public', methods=['GET'])
+    def get_dashboard_metrics(self, **kwargs):
+        """
+        Performance metrics of the dashboard in the Prometheus text format,
+        summed over all the worker processes of the server (see
+        instrumentation.expose_metrics): any worker can serve the scrape.
+        Scrapers authenticate with the project_dashboard.metrics_token system
+        parameter as a bearer token; the route does not exist while no token is
+        configured.
+        """
+        token = request.env['ir.config_parameter'].sudo().get_param('project_dashboard.metrics_token')
+        authorization = request.httprequest.headers.get('Authorization', '')
+        if not token or not consteq(authorization, f'Bearer {token}'):
+            raise NotFound()
+        return request.make_response(instrumentation.expose_metrics(), headers=[
+            ('Content-Type', 'text/plain; version=0.0.4; charset=utf-8'),
+        ])
+
+    def _get_dashboard_job(self, job_id):
+        # The record rules restrict the jobs to their user
+        job = request.env['project_dashboard.job'].browse(int(job_id)).exists()
+        if not job:
+            raise NotFound()
+        job.check_access_rule('read')
+        return job
+
+    def _record_dashboard_stats(self, values, stats, elapsed):
+        """Record the timings of a dashboard request, log them and return them as the _meta block."""
+        widget_timings.record('get_dashboard_data', elapsed * 1000)
+        instrumentation.request_duration.observe(elapsed, data_source=values['data_source'])
+        for key, widget_stats in stats.items():
+            widget_timings.record(key, widget_stats['time'] * 1000)
+            instrumentation.widget_duration.observe(widget_stats['time'], widget=key)
+            instrumentation.widget_queries.inc(widget_stats['queries'], widget=key)
+            instrumentation.widget_rows.inc(widget_stats['rows'], widget=key)
+        for key, marker in values.get('degraded_widgets', {}).items():
+            instrumentation.widget_degraded.inc(widget=key, reason=marker['reason'])
+        # The payload size is measured on the serialized response, see ir.http
+
+        meta = {
+            'time_ms': round(elapsed * 1000, 1),
+            'data_source': values['data_source'],
+            'widgets': {
+                key: {
+                    'time_ms': round(widget_stats['time'] * 1000, 1),
+                    'queries': widget_stats['queries'],
+                    'sql_time_ms': round(widget_stats['sql_time'] * 1000, 1),
+                }
+                for key, widget_stats in stats.items()
             },
-            'weekly_developer_utilization': Tasks._get_weekly_developer_utilization(start_date, end_date),
-            'task_distribution': Tasks._get_task_distribution(start_date, end_date),
-            'bug_resolution': Tasks._get_bug_resolution_data(start_date, end_date, 'day'),
-            'capacity_allocation': Tasks._get_capacity_allocation_data(start_date, end_date, 'day'),
-            'recent_projects': self._get_recent_projects(),
-            'task_completion': Tasks._get_task_completion_data(start_date, end_date),
-            'project_progress': Tasks._get_project_progress_data(),
-            'timesheet_compliance': Tasks._get_timesheet_compliance_data(),
-            'task_overruns': Tasks._get_task_overruns_data(),
-            'weekly_burn_rate': Tasks._get_weekly_burn_rate_data(start_date, end_date, 'day'),
-            'task_backlog': Tasks._get_task_backlog_data()
         }
-        return values
+        _logger.info("project_dashboard request %s", json.dumps(dict(meta, uid=request.env.uid)))
+        return meta
+
+    def _store_profile(self, profiler, stats):
+        """
+        Store the Python profile and the SQL statements of a profiled dashboard
+        request as a zip attachment (dashboard.pstats, sql.json) of the current
+        user, and return its download link.
+        """
+        profiler.create_stats()
+        statements = [
+            {'widget': key, 'query': query, 'duration_ms': round(duration * 1000, 3)}
+            for key, widget_stats in stats.items()
+            for query, duration in self._render_statements(widget_stats)
+        ]
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr('dashboard.pstats', marshal.dumps(profiler.stats))
+            archive.writestr('sql.json', json.dumps(statements, indent=2))
+
+        attachment = request.env['ir.attachment'].create({
+            'name': f"project_dashboard_profile_{fields.Datetime.now():%Y%m%d_%H%M%S}.zip",
+            'raw': buffer.getvalue(),
+            'mimetype': 'application/zip',
+            'res_model': 'res.users',
+            'res_id': request.env.uid,
+        })
+        return {
+            'attachment_id': attachment.id,
+            'url': f'/web/content/{attachment.id}?download=true',
+        }
 
+    def _log_slow_widgets(self, stats, parameters):
+        """
+        Record the widgets that took longer than the project_dashboard.slow_widget_ms
+        system parameter in project_dashboard.slow_log, with their SQL statements
+        and the plan of their slowest query. The plans are computed in a
+        background thread so that the EXPLAIN ANALYZE does not delay the response.
+        """
+        threshold_ms = self._get_slow_widget_threshold()
+        slow_widgets = [
+            (key, widget_stats, self._render_statements(widget_stats))
+            for key, widget_stats in stats.items()
+            if threshold_ms and widget_stats['time'] * 1000 >= threshold_ms
+        ]
+        if not slow_widgets:
+            return
+        registry, uid = request.env.registry, request.env.uid
+
+        def log_slow_widgets():
+            try:
+                with registry.cursor() as cr:
+                    SlowLog = api.Environment(cr, SUPERUSER_ID, {})['project_dashboard.slow_log']
+                    for key, widget_stats, statements in slow_widgets:
+                        SlowLog._log_slow_widget(key, uid, widget_stats, statements, parameters)
+            except Exception:
+                _logger.warning("Could not log the slow dashboard widgets", exc_info=True)
+
+        if registry.in_test_mode():
+            log_slow_widgets()
+        else:
+            threading.Thread(target=log_slow_widgets, name='project_dashboard.slow_log', daemon=True).start()
+
+    def _get_slow_widget_threshold(self):
+        ICP = request.env['ir.config_parameter'].sudo()
+        return int(ICP.get_param('project_dashboard.slow_widget_ms', 5000))
+
+    def _render_statements(self, widget_stats):
+        """Return the statements captured for a widget as (sql, duration) pairs."""
+        return [
+            (request.env.cr.mogrify(query, params).decode(), duration)
+            for query, params, duration in widget_stats.get('statements', [])
+        ]
 
-    def _get_recent_projects(self):
-        Project = request.env['project.project']
-        projects = Project.search([('active', '=', True)], limit=5, order='create_date desc')
-        return [{
-            'name': project.name,
-            'progress': self._calculate_project_progress(project),
-            'tasks': len(project.task_ids),
-            'hours': round(sum(project.task_ids.mapped('effective_hours') or [0]), 2),
-            'status': self._get_project_status(project),
-            'status_class': self._get_status_class(self._get_project_status(project))
-        } for project in projects]
-
-    def _calculate_project_progress(self, project):
-        if not project.task_ids:
-            return 0
-        completed = len(project.task_ids.filtered(lambda t: t.stage_id.fold))
-        return round((completed / len(project.task_ids)) * 100, 2)
-
-
-    def _get_project_status(self, project):
-        if not project.task_ids:
-            return 'draft'
-        if all(task.stage_id.fold for task in project.task_ids):
-            return 'completed'
-        if any(task.is_overdue for task in project.task_ids):
-            return 'delayed'
-        return 'in_progress'
-
-    def _get_status_class(self, status):
-        status_classes = {
-            'draft': 'bg-secondary',
-            'completed': 'bg-success',
-            'delayed': 'bg-danger',
-            'in_progress': 'bg-info'
-        }
-        return status_classes.get(status, 'bg-secondary')
+    def _get_parallel_workers(self):
+        ICP = request.env['ir.config_parameter'].sudo()
+        return int(ICP.get_param('project_dashboard.parallel_workers', 4))
+
+    def _get_widget_budget(self, env, key):
+        """
+        Return the (timeout_ms, max_queries) budget of a widget. The defaults come
+        from the project_dashboard.widget_timeout_ms and project_dashboard.widget_max_queries
+        system parameters, and can be overridden per widget by suffixing them with
+        the widget key (e.g. project_dashboard.widget_timeout_ms.capacity_allocation).
+        A value of 0 disables that limit.
+        """
+        ICP = env['ir.config_parameter'].sudo()
+        timeout_ms = (ICP.get_param(f'project_dashboard.widget_timeout_ms.{key}')
+                      or ICP.get_param('project_dashboard.widget_timeout_ms', 20000))
+        max_queries = (ICP.get_param(f'project_dashboard.widget_max_queries.{key}')
+                       or ICP.get_param('project_dashboard.widget_max_queries', 1000))
+        return int(timeout_ms), int(max_queries)
+
+    def _get_dashboard_values(self, env, widgets, parallel=False, cursor_factory=None, share_snapshot=True,
+                              fallbacks=None, cache_key=(), stats=None, capture_sql=False):
+        budgets = {key: self._get_widget_budget(env, key) for key in widgets}
+        stats = stats if stats is not None else {}
+        for key in widgets:
+            stats[key] = {'time': 0.0, 'queries': 0, 'rows': 0, 'sql_time': 0.0}
+            if capture_sql:
+                stats[key]['statements'] = []
+
+        if parallel:
+            results = self._compute_widgets_parallel(env, widgets, budgets, cursor_factory, share_snapshot, stats)
+        else:
+            results = {}
+            for key, compute in widgets.items():
+                try:
+                    results[key] = self._compute_within_budget(env, key, compute, budgets[key], stats[key])
+                except WidgetBudgetExceeded as e:
+                    results[key] = e
+
+        values = {}
+        degraded = {}
+        for key, result in results.items():
+            result_key = (env.cr.dbname, env.uid, key) + tuple(cache_key)
+            if isinstance(result, WidgetBudgetExceeded):
+                _logger.warning("%s, serving degraded data", result)
+                values[key], degraded[key] = self._get_widget_fallback(
+                    env, key, result.reason, result_key, (fallbacks or {}).get(key), budgets[key])
+            else:
+                last_results.set(result_key, (fields.Datetime.now(), result))
+                values[key] = result
+        if degraded:
+            values['degraded_widgets'] = degraded
+        return values
+
+    def _compute_widgets_parallel(self, env, widgets, budgets, cursor_factory, share_snapshot=True, stats=None):
+        # Every widget runs on its own cursor; on the primary they all import the
+        # snapshot of the calling transaction so that the merged result stays consistent.
+        snapshot = None
+        if share_snapshot:
+            env.cr.execute("SELECT pg_export_snapshot()")
+            snapshot = env.cr.fetchone()[0]
+
+        workers = min(self._get_parallel_workers(), len(widgets))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='project_dashboard') as executor:
+            futures = {
+                key: executor.submit(
+                    self._compute_widget, cursor_factory, env.uid, env.context,
+                    functools.partial(self._compute_within_budget, key=key, compute=compute, budget=budgets[key],
+                                      stats=(stats or {}).get(key)),
+                    snapshot)
+                for key, compute in widgets.items()
+            }
+            results = {}
+            for key, future in futures.items():
+                try:
+                    results[key] = future.result()
+                except WidgetBudgetExceeded as e:
+                    results[key] = e
+            return results
+
+    def _compute_widget(self, cursor_factory, uid, context, compute, snapshot=None):
+        cr = cursor_factory()
+        if cr is None:
+            raise psycopg2.OperationalError("No cursor available for the dashboard widget")
+        with closing(cr):
+            if snapshot:
+                cr.execute("SET TRANSACTION SNAPSHOT %s", [snapshot])
+            return compute(api.Environment(cr, uid, context))
+
+    def _compute_within_budget(self, env, key, compute, budget, stats=None):
+        """
+        Compute a widget under its (timeout_ms, max_queries) budget: every statement
+        is bounded by statement_timeout and the widget as a whole by query_budget.
+        Raise WidgetBudgetExceeded when the budget is exhausted. The wall time,
+        query count and SQL time of the widget are accumulated in ``stats``.
+        """
+        timeout_ms, max_queries = budget
+        started = time.perf_counter()
+        cr = env.cr
+        cr.execute("SHOW statement_timeout")
+        previous_timeout = cr.fetchone()[0]
+        try:
+            with cr.savepoint(flush=False):
+                if timeout_ms:
+                    cr.execute("SET LOCAL statement_timeout = %s", [timeout_ms])
+                with query_budget(cr, key, max_queries, timeout_ms, stats):
+                    return compute(env)
+        except psycopg2.errors.QueryCanceled:
+            env.invalidate_all(flush=False)
+            raise WidgetBudgetExceeded(key, 'timeout')
+        except WidgetBudgetExceeded:
+            env.invalidate_all(flush=False)
+            raise
+        finally:
+            cr.execute("SET LOCAL statement_timeout = %s", [previous_timeout])
+            if stats is not None:
+                stats['time'] += time.perf_counter() - started
+
+    def _get_widget_fallback(self, env, key, reason, result_key, coarse_compute, budget):
+        """
+        Return the (value, marker) pair served for a widget that ran over budget:
+        the last good result computed by this worker, else its coarser-grained
+        variant, else no data.
+        """
+        cached = last_results.get(result_key)
+        if cached:
+            as_of, value = cached
+            return value, {'reason': reason, 'fallback': 'cache', 'as_of': fields.Datetime.to_string(as_of)}
+        if coarse_compute:
+            try:
+                return self._compute_within_budget(env, key, coarse_compute, budget), \
+                    {'reason': reason, 'fallback': 'coarse'}
+            except WidgetBudgetExceeded:
+                _logger.warning("Coarse fallback of dashboard widget %r also exceeded its budget", key)
+        return None, {'reason': reason, 'fallback': None}
 
 
 
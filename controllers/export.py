@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+import csv
+import io
+import tempfile
+
+import xlsxwriter
+from werkzeug.exceptions import NotFound
+
+from odoo import api, http
+from odoo.http import content_disposition, request
+
+# Rows fetched at a time from the server-side cursor of the raw exports
+EXPORT_BATCH_SIZE = 5000
+# Data rows per sheet of an XLSX export (the format allows 1048576 rows, header included)
+XLSX_MAX_ROWS = 1048575
+EXPORT_CONTENT_TYPES = {
+    'csv': 'text/csv; charset=utf-8',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+}
+
+
+class ProjectDashboardExport(http.Controller):
+
+    @http.route('/project/dashboard/export/widget/<string:widget>', type='http', auth='user')
+    def export_widget(self, widget, start_date=None, end_date=None, file_format='csv', interval='auto', **kwargs):
+        """Export the data of one dashboard widget, as plotted, over the given range."""
+        Dashboard = request.env['project_dashboard.data']
+        start, end = Dashboard._parse_date_range(start_date, end_date)
+        widgets = Dashboard._get_dashboard_widgets(start, end, interval=interval)
+        if widget not in widgets or file_format not in EXPORT_CONTENT_TYPES:
+            raise NotFound()
+
+        header, rows = self._get_widget_table(widget, widgets[widget](request.env))
+        filename = f"{widget}_{start:%Y-%m-%d}_{end:%Y-%m-%d}.{file_format}"
+        return self._make_export_response(header, [rows], file_format, filename)
+
+    @http.route('/project/dashboard/export/<any(timesheets,tasks):dataset>', type='http', auth='user')
+    def export_dataset(self, dataset, start_date=None, end_date=None, file_format='csv', **kwargs):
+        """
+        Export the rows underlying the dashboard: the hours logged per user and
+        day over the given range (timesheets), or every task by project (tasks).
+        The rows are read from a server-side cursor in batches of
+        EXPORT_BATCH_SIZE while the file is streamed.
+        """
+        if file_format not in EXPORT_CONTENT_TYPES:
+            raise NotFound()
+        start, end = request.env['project_dashboard.data']._parse_date_range(start_date, end_date)
+        Task = request.env['project.task']
+
+        if dataset == 'timesheets':
+            from_clause, where_clause, params = Task._dashboard_query([
+                ('project_id', '!=', False),
+                ('date', '>=', start.date()),
+                ('date', '<=', end.date()),
+            ], 'account.analytic.line')
+            query = f"""
+                SELECT partner.name, "account_analytic_line".date,
+                       SUM("account_analytic_line".unit_amount), COUNT(*)
+                  FROM {from_clause}
+                  JOIN res_users users ON users.id = "account_analytic_line".user_id
+                  JOIN res_partner partner ON partner.id = users.partner_id
+                 WHERE {where_clause}
+              GROUP BY users.id, partner.name, "account_analytic_line".date
+              ORDER BY partner.name, users.id, "account_analytic_line".date
+            """
+            header = ['User', 'Date', 'Hours', 'Timesheet Lines']
+            batches = self._iter_query_batches(query, params)
+        else:
+            from_clause, where_clause, params = Task._dashboard_query([])
+            query = f"""
+                SELECT "project_task".project_id, "project_task".id, "project_task".name,
+                       "project_task".stage_id, "project_task".task_type,
+                       "project_task".planned_hours, "project_task".effective_hours,
+                       "project_task".actual_hours, "project_task".date_deadline,
+                       "project_task".create_date
+                  FROM {from_clause}
+                 WHERE {where_clause}
+              ORDER BY "project_task".project_id, "project_task".id
+            """
+            header = ['Project', 'Task ID', 'Task', 'Stage', 'Task Type', 'Planned Hours',
+                      'Effective Hours', 'Actual Hours', 'Deadline', 'Created on']
+            batches = self._iter_query_batches(query, params, self._format_task_rows)
+
+        filename = f"{dataset}_{start:%Y-%m-%d}_{end:%Y-%m-%d}.{file_format}"
+        return self._make_export_response(header, batches, file_format, filename)
+
+    def _iter_query_batches(self, query, params, format_rows=None):
+        """
+        Return a generator of the rows of ``query`` in batches, read from a
+        server-side cursor. The response body is produced after the request
+        cursor is closed, so the generator reads from its own cursor (on the
+        replica when one is configured); ``format_rows(env, rows)`` can
+        post-process each batch in an environment of that cursor.
+        """
+        registry = request.env.registry
+        uid, context = request.env.uid, dict(request.env.context)
+        Dashboard = request.env['project_dashboard.data']
+
+        def batches():
+            cr = Dashboard._get_replica_cursor() or registry.cursor()
+            with cr:
+                cr.execute(f"DECLARE project_dashboard_export NO SCROLL CURSOR FOR {query}", params)
+                env = api.Environment(cr, uid, context)
+                while True:
+                    cr.execute("FETCH FORWARD %s FROM project_dashboard_export", [EXPORT_BATCH_SIZE])
+                    rows = cr.fetchall()
+                    if not rows:
+                        break
+                    yield format_rows(env, rows) if format_rows else rows
+                    env.invalidate_all(flush=False)
+
+        return batches()
+
+    def _format_task_rows(self, env, rows):
+        """Replace the project and stage ids of a batch of task rows by their names."""
+        projects = dict(env['project.project'].browse({row[0] for row in rows if row[0]}).name_get())
+        stages = dict(env['project.task.type'].browse({row[3] for row in rows if row[3]}).name_get())
+        return [
+            (projects.get(project_id, ''), task_id, name, stages.get(stage_id, ''), *values)
+            for project_id, task_id, name, stage_id, *values in rows
+        ]
+
+    def _get_widget_table(self, key, data):
+        """Return the (header, rows) table of the data of a dashboard widget."""
+        if key == 'summary':
+            return ['Metric', 'Value'], list(data.items())
+        if key == 'recent_projects':
+            return ['Project', 'Progress (%)', 'Tasks', 'Hours', 'Status'], [
+                (project['name'], project['progress'], project['tasks'], project['hours'], project['status'])
+                for project in data
+            ]
+        if key == 'task_distribution':
+            return ['Developer', 'Task Type', 'Hours'], [
+                (developer['developer'], category['type'], category['hours'])
+                for developer in data
+                for category in developer['categories']
+            ]
+        if key == 'capacity_allocation':
+            return ['Developer'] + data['weeks'], [
+                [developer] + row for developer, row in zip(data['developers'], data['data'])
+            ]
+        if key == 'project_progress':
+            return ['Project', 'Completed', 'Remaining', 'Total', 'Completion (%)'], list(zip(
+                data['labels'], data['completed'], data['remaining'], data['total_tasks'], data['percentages'],
+            ))
+        if key == 'task_overruns':
+            data = data['data']
+        # Chart.js data: one row per label, one column per dataset
+        datasets = data['datasets']
+        return [''] + [dataset.get('label', '') for dataset in datasets], [
+            [label] + [dataset['data'][index] for dataset in datasets]
+            for index, label in enumerate(data['labels'])
+        ]
+
+    def _make_export_response(self, header, batches, file_format, filename):
+        writer = self._write_csv if file_format == 'csv' else self._write_xlsx
+        response = request.make_response(writer(header, batches), headers=[
+            ('Content-Type', EXPORT_CONTENT_TYPES[file_format]),
+            ('Content-Disposition', content_disposition(filename)),
+        ])
+        response.direct_passthrough = True
+        return response
+
+    def _write_csv(self, header, batches):
+        """Yield the CSV file batch by batch."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(header)
+        for rows in batches:
+            writer.writerows(rows)
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode()
+
+    def _write_xlsx(self, header, batches):
+        """
+        Write the rows to an XLSX file on disk, flushing each row as it is
+        written (constant_memory mode) and starting a new sheet every
+        XLSX_MAX_ROWS rows, then yield the file in chunks.
+        """
+        with tempfile.TemporaryFile() as file:
+            workbook = xlsxwriter.Workbook(file, {
+                'constant_memory': True,
+                'default_date_format': 'yyyy-mm-dd',
+                'remove_timezone': True,
+            })
+            sheet, row_index = None, XLSX_MAX_ROWS
+            for rows in batches:
+                for row in rows:
+                    if row_index >= XLSX_MAX_ROWS:
+                        sheet, row_index = workbook.add_worksheet(), 1
+                        sheet.write_row(0, 0, header)
+                    sheet.write_row(row_index, 0, row)
+                    row_index += 1
+            if sheet is None:
+                workbook.add_worksheet().write_row(0, 0, header)
+            workbook.close()
+
+            file.seek(0)
+            yield from iter(lambda: file.read(64 * 1024), b'')
@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+import glob
+import json
+import logging
+import math
+import os
+import socket
+import threading
+import time
+from collections import OrderedDict, defaultdict, deque
+from contextlib import contextmanager
+
+from odoo.tools import config
+
+_logger = logging.getLogger(__name__)
+
+
+class WidgetBudgetExceeded(Exception):
+    """Raised when a dashboard widget exceeds its time or query budget."""
+
+    def __init__(self, widget, reason):
+        super().__init__(f"Dashboard widget {widget!r} exceeded its budget ({reason})")
+        self.widget = widget
+        self.reason = reason
+
+
+@contextmanager
+def query_budget(cr, widget, max_queries=0, timeout_ms=0, stats=None):
+    """
+    Count the statements executed on ``cr`` and raise WidgetBudgetExceeded as
+    soon as more than ``max_queries`` of them are issued, or when a new one
+    starts after ``timeout_ms`` have elapsed. A falsy limit disables that check.
+
+    When given, the ``stats`` dict accumulates the number of statements
+    (``queries``), the rows they returned or affected (``rows``) and the time
+    spent executing them (``sql_time``, in seconds).
+    If it holds a ``statements`` list, every (query, params, duration) triple is
+    appended to it; use ``cr.mogrify`` to render them when they are needed.
+    """
+    execute = cr.execute
+    deadline = time.monotonic() + timeout_ms / 1000.0 if timeout_ms else None
+    count = 0
+
+    def budgeted_execute(query, params=None, log_exceptions=True):
+        nonlocal count
+        count += 1
+        if max_queries and count > max_queries:
+            raise WidgetBudgetExceeded(widget, 'query_budget')
+        if deadline and time.monotonic() > deadline:
+            raise WidgetBudgetExceeded(widget, 'timeout')
+        started = time.perf_counter()
+        try:
+            return execute(query, params, log_exceptions)
+        finally:
+            if stats is not None:
+                duration = time.perf_counter() - started
+                stats['queries'] = stats.get('queries', 0) + 1
+                stats['rows'] = stats.get('rows', 0) + max(cr.rowcount, 0)
+                stats['sql_time'] = stats.get('sql_time', 0.0) + duration
+                if 'statements' in stats:
+                    stats['statements'].append((query, params, duration))
+
+    previous = cr.__dict__.get('execute')
+    cr.execute = budgeted_execute
+    try:
+        yield
+    finally:
+        if previous is None:
+            del cr.execute
+        else:
+            cr.execute = previous
+
+
+class ResultCache:
+    """Small thread-safe LRU keeping the last good result of each widget in this worker."""
+
+    def __init__(self, name, maxsize=256):
+        self.name = name
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._data:
+                cache_requests.inc(cache=self.name, result='miss')
+                return None
+            cache_requests.inc(cache=self.name, result='hit')
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+class RollingTimings:
+    """Rolling window of the last durations (in ms) recorded per key in this worker."""
+
+    def __init__(self, size=500):
+        self._samples = defaultdict(lambda: deque(maxlen=size))
+        self._lock = threading.Lock()
+
+    def record(self, key, duration_ms):
+        with self._lock:
+            self._samples[key].append(duration_ms)
+
+    def summary(self):
+        with self._lock:
+            samples = {key: sorted(values) for key, values in self._samples.items()}
+        return {
+            key: {
+                'count': len(values),
+                'p50': round(percentile(values, 50), 1),
+                'p95': round(percentile(values, 95), 1),
+            }
+            for key, values in samples.items()
+        }
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100.0 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+class Metric:
+    """
+    Prometheus metric of this process. Each process dumps its metrics with
+    `dump_metrics`, and `expose_metrics` merges those of all the processes.
+    """
+
+    type = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        METRICS.append(self)
+
+    def _key(self, labels):
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def _format_labels(self, key, **extra):
+        pairs = list(zip(self.labelnames, key)) + list(extra.items())
+        if not pairs:
+            return ''
+        return '{%s}' % ','.join(f'{name}="{escape_label(value)}"' for name, value in pairs)
+
+    def snapshot(self):
+        """Return the values of this process as JSON-serializable [labels, value] pairs."""
+        with self._lock:
+            return [[list(key), value] for key, value in self._values.items()]
+
+    def expose(self, values):
+        """Return the lines of the text format of ``values``, a {labels: value} dict."""
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.type}']
+        for key, value in sorted(values.items()):
+            lines += self._expose_value(key, value)
+        return lines
+
+
+class Counter(Metric):
+    type = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def merge(self, value, other):
+        return value + other
+
+    def _expose_value(self, key, value):
+        return [f'{self.name}{self._format_labels(key)} {value}']
+
+
+class Histogram(Metric):
+    type = 'histogram'
+
+    def __init__(self, name, documentation, buckets, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = sorted(buckets)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            counts, total, observations = self._values.get(key, ([0] * len(self.buckets), 0.0, 0))
+            counts = [count + (value <= bound) for count, bound in zip(counts, self.buckets)]
+            self._values[key] = (counts, total + value, observations + 1)
+
+    def merge(self, value, other):
+        (counts, total, observations), (other_counts, other_total, other_observations) = value, other
+        return ([count + other_count for count, other_count in zip(counts, other_counts)],
+                total + other_total, observations + other_observations)
+
+    def _expose_value(self, key, value):
+        counts, total, observations = value
+        lines = [
+            f'{self.name}_bucket{self._format_labels(key, le=str(bound))} {count}'
+            for bound, count in zip(self.buckets, counts)
+        ]
+        return lines + [
+            f'{self.name}_bucket{self._format_labels(key, le="+Inf")} {observations}',
+            f'{self.name}_sum{self._format_labels(key)} {total}',
+            f'{self.name}_count{self._format_labels(key)} {observations}',
+        ]
+
+
+def escape_label(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def get_metrics_directory():
+    """Directory of the metrics files of the processes, in the data directory of the server."""
+    return os.path.join(config['data_dir'], 'project_dashboard_metrics')
+
+
+_metrics_file = {'pid': None, 'path': None}
+_dump_lock = threading.Lock()
+
+
+def _get_metrics_path():
+    # The workers are forked from the server process: the file is chosen by the process itself
+    if _metrics_file['pid'] != os.getpid():
+        _metrics_file['pid'] = os.getpid()
+        _metrics_file['path'] = os.path.join(
+            get_metrics_directory(), f'{socket.gethostname()}-{os.getpid()}-{time.time_ns()}.json')
+    return _metrics_file['path']
+
+
+def dump_metrics():
+    """
+    Write the metrics of this process to its file in the metrics directory,
+    where `expose_metrics` reads the metrics of all the processes.
+    """
+    snapshot = {metric.name: metric.snapshot() for metric in METRICS}
+    path = _get_metrics_path()
+    with _dump_lock:
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(f'{path}.tmp', 'w') as file:
+                json.dump(snapshot, file)
+            os.replace(f'{path}.tmp', path)
+        except OSError:
+            _logger.warning("Could not write the dashboard metrics to %s", path, exc_info=True)
+
+
+def expose_metrics():
+    """
+    Return the metrics of all the processes of the server in the Prometheus
+    text exposition format: the counters and histograms dumped by each
+    process are summed, whichever worker serves the scrape. The files that no
+    process updated for METRICS_RETENTION seconds are removed, which the
+    scraper sees as a counter reset.
+    """
+    dump_metrics()
+    values = defaultdict(dict)
+    for path in glob.glob(os.path.join(get_metrics_directory(), '*.json')):
+        try:
+            if os.path.getmtime(path) < time.time() - METRICS_RETENTION:
+                os.remove(path)
+                continue
+            with open(path) as file:
+                snapshot = json.load(file)
+        except (OSError, ValueError):
+            continue  # removed or replaced meanwhile
+        for metric in METRICS:
+            metric_values = values[metric.name]
+            for key, value in snapshot.get(metric.name, []):
+                key = tuple(key)
+                metric_values[key] = metric.merge(metric_values[key], value) if key in metric_values else value
+
+    lines = []
+    for metric in METRICS:
+        lines += metric.expose(values[metric.name])
+    return '\n'.join(lines) + '\n'
+
+
+METRICS = []
+
+# Seconds after which the metrics file of a process that stopped updating it is removed
+METRICS_RETENTION = 7 * 24 * 3600
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+request_duration = Histogram(
+    'project_dashboard_request_duration_seconds', "Duration of the dashboard data requests.",
+    LATENCY_BUCKETS, ['data_source'])
+widget_duration = Histogram(
+    'project_dashboard_widget_duration_seconds', "Duration of the computation of each dashboard widget.",
+    LATENCY_BUCKETS, ['widget'])
+widget_queries = Counter(
+    'project_dashboard_widget_queries_total', "SQL statements executed by each dashboard widget.", ['widget'])
+widget_rows = Counter(
+    'project_dashboard_widget_rows_total', "Rows returned or affected by the SQL statements of each widget.",
+    ['widget'])
+widget_degraded = Counter(
+    'project_dashboard_widget_degraded_total', "Widgets served degraded data after exceeding their budget.",
+    ['widget', 'reason'])
+cache_requests = Counter(
+    'project_dashboard_cache_requests_total', "Lookups in the dashboard caches.", ['cache', 'result'])
+payload_bytes = Histogram(
+    'project_dashboard_payload_bytes', "Size of the JSON payload of the dashboard data requests.",
+    (1e3, 1e4, 1e5, 5e5, 1e6, 5e6, 1e7))
+
+# Last good result per (database, user, widget, parameters), used as fallback
+# when a widget runs over its budget.
+last_results = ResultCache('last_result')
+
+# Durations of the dashboard requests and of each widget in this worker.
+widget_timings = RollingTimings()
@@ -1,3 +1,8 @@
 # -*- coding: utf-8 -*-
 
-from . import project_task
\ No newline at end of file
+from . import project_task
+from . import dashboard_slow_log
+from . import dashboard_monthly_rollup
+from . import dashboard_job
+from . import dashboard_data
+from . import ir_http
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+import threading
+
+
+class DashboardContext:
+    """
+    Records shared by the widgets of one dashboard request: the internal
+    users, the active employees, the task stages, the active projects and the
+    chart colors. Each of them is loaded on first use, with only the columns
+    the widgets need, and then reused by the other widgets of the request.
+
+    The values are plain data, not recordsets, so that the widgets computed in
+    parallel on their own cursors can share them.
+    """
+
+    def __init__(self):
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _get(self, env, key, load):
+        with self._lock:
+            if key not in self._values:
+                self._values[key] = load(env)
+            return self._values[key]
+
+    def users(self, env):
+        """The internal users, as {'id', 'name'} dicts in the order of res.users."""
+        return self._get(env, 'users', lambda env: env['res.users'].search_read([('share', '=', False)], ['name']))
+
+    def user_ids(self, env):
+        return [user['id'] for user in self.users(env)]
+
+    def employees(self, env):
+        """The active employees, as {'id', 'name', 'user_id'} dicts (user_id is an id or False)."""
+        return self._get(env, 'employees', lambda env: env['hr.employee'].search_read(
+            [('active', '=', True)], ['name', 'user_id'], load=None))
+
+    def stages(self, env):
+        """The task stages, archived ones included, as {id: {'fold', 'sequence'}}."""
+        return self._get(env, 'stages', lambda env: {
+            stage['id']: stage
+            for stage in env['project.task.type'].with_context(active_test=False).search_read(
+                [], ['fold', 'sequence'])
+        })
+
+    def projects(self, env):
+        """The active projects, as {id: {'id', 'name', 'user_id'}} (user_id is an id or False)."""
+        return self._get(env, 'projects', lambda env: {
+            project['id']: project
+            for project in env['project.project'].search_read([('active', '=', True)], ['name', 'user_id'],
+                                                              load=None)
+        })
+
+    def colors(self, env, type='primary'):
+        return self._get(env, ('colors', type), lambda env: env['project.task']._get_chart_colors(type))
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+import functools
+import logging
+from datetime import datetime, timedelta
+
+import psycopg2
+
+from odoo import _, api, models, sql_db
+from odoo.exceptions import UserError
+from odoo.tools import config
+
+from .dashboard_context import DashboardContext
+
+_logger = logging.getLogger(__name__)
+
+
+class DashboardData(models.AbstractModel):
+    """
+    Computation of the dashboard data, shared by the data route, the
+    background jobs and the exports: the parsing of the range and options,
+    the widgets, and the read-only replica cursor.
+    """
+    _name = 'project_dashboard.data'
+    _description = 'Dashboard Data'
+
+    @api.model
+    def _parse_date_range(self, start_date=None, end_date=None):
+        """
+        Return the (start, end) datetimes of the '%Y-%m-%d' bounds, defaulting
+        to the last 30 days. Reversed bounds are swapped.
+        """
+        # Convert date strings to datetime objects
+        try:
+            if start_date:
+                start_date = datetime.strptime(start_date, '%Y-%m-%d')
+            else:
+                # Default to 30 days ago if no start date provided
+                start_date = datetime.now() - timedelta(days=30)
+
+            if end_date:
+                end_date = datetime.strptime(end_date, '%Y-%m-%d')
+            else:
+                # Default to current date if no end date provided
+                end_date = datetime.now()
+        except ValueError:
+            # Fallback to default date range if parsing fails
+            start_date = datetime.now() - timedelta(days=30)
+            end_date = datetime.now()
+        if start_date > end_date:
+            start_date, end_date = end_date, start_date
+        return start_date, end_date
+
+    @api.model
+    def _parse_dashboard_options(self, start_date, end_date, limit=None, offset=0, max_points=None,
+                                 interval='auto'):
+        """
+        Return the (limit, offset, max_points, interval) options of a dashboard
+        request, normalized. Raise a UserError when a number is not an integer.
+        """
+        try:
+            # Page of the high-cardinality widgets (project progress, task overruns)
+            limit = max(int(limit), 1) if limit else None
+            offset = max(int(offset or 0), 0)
+            # Bound on the number of points of the time series (capacity allocation, burn rate)
+            max_points = max(int(max_points), 3) if max_points else None
+        except (TypeError, ValueError):
+            raise UserError(_("The limit, offset and number of points of the dashboard must be integers."))
+        # Interval of the time series (bug resolution, capacity allocation, burn rate)
+        interval = self.env['project.task']._resolve_dashboard_interval(start_date, end_date, interval)
+        return limit, offset, max_points, interval
+
+    @api.model
+    def _get_replica_cursor(self):
+        """
+        Return a read-only cursor on the database configured by the
+        ``dashboard_replica_db`` server option (a database name or a
+        ``postgresql://`` URI), or None when there is none or it cannot be reached.
+        """
+        replica = config.get('dashboard_replica_db')
+        if not replica:
+            return None
+        cr = None
+        try:
+            cr = sql_db.db_connect(replica, allow_uri=True).cursor()
+            cr.execute("SET TRANSACTION READ ONLY")
+        except psycopg2.Error:
+            _logger.warning("Dashboard replica unavailable, using the primary database", exc_info=True)
+            if cr:
+                cr.close()
+            return None
+        return cr
+
+    @api.model
+    def _get_dashboard_widgets(self, start_date, end_date, limit=None, offset=0, max_points=None,
+                               interval='auto', dashboard_context=None):
+        """
+        Return the dashboard widgets as an ordered mapping of response key to a
+        function computing that widget from an environment. The widgets share
+        ``dashboard_context`` (a new one by default).
+        """
+        dashboard_context = dashboard_context or DashboardContext()
+        task_widget = functools.partial(self._make_widget, dashboard_context, 'project.task')
+        data_widget = functools.partial(self._make_widget, dashboard_context, self._name)
+
+        return {
+            'summary': data_widget('_get_summary'),
+            'weekly_developer_utilization': task_widget('_get_weekly_developer_utilization', start_date, end_date),
+            'task_distribution': task_widget('_get_task_distribution', start_date, end_date),
+            'bug_resolution': task_widget('_get_bug_resolution_data', start_date, end_date, interval, max_points),
+            'capacity_allocation': task_widget('_get_capacity_allocation_data', start_date, end_date, interval,
+                                               max_points),
+            'recent_projects': data_widget('_get_recent_projects'),
+            'task_completion': task_widget('_get_task_completion_data', start_date, end_date),
+            'project_progress': task_widget('_get_project_progress_data', limit, offset),
+            'timesheet_compliance': task_widget('_get_timesheet_compliance_data'),
+            'task_overruns': task_widget('_get_task_overruns_data', limit, offset),
+            'weekly_burn_rate': task_widget('_get_weekly_burn_rate_data', start_date, end_date, interval,
+                                            max_points),
+            'task_backlog': task_widget('_get_task_backlog_data'),
+        }
+
+    @api.model
+    def _get_dashboard_fallbacks(self, start_date, end_date, max_points=None, dashboard_context=None):
+        """Coarser-grained variants of the widgets, computed when the regular one runs over budget."""
+        task_widget = functools.partial(self._make_widget, dashboard_context or DashboardContext(), 'project.task')
+        return {
+            'bug_resolution': task_widget('_get_bug_resolution_data', start_date, end_date, 'month', max_points),
+            'capacity_allocation': task_widget('_get_capacity_allocation_data', start_date, end_date, 'month',
+                                               max_points),
+            'weekly_burn_rate': task_widget('_get_weekly_burn_rate_data', start_date, end_date, 'month', max_points),
+        }
+
+    @api.model
+    def _make_widget(self, dashboard_context, model, method, *args):
+        """Return a function computing the widget ``model.method(*args)`` from an environment."""
+        return lambda env: getattr(env[model], method)(*args, dashboard_context=dashboard_context)
+
+    @api.model
+    def _get_summary(self, dashboard_context=None):
+        dashboard_context = dashboard_context or DashboardContext()
+        env = self.env
+        Tasks = env['project.task']
+
+        active_projects = dashboard_context.projects(env)
+        stages = dashboard_context.stages(env)
+        team_members = {project['user_id'] for project in active_projects.values() if project['user_id']}
+
+        # Task count and hours from timesheets per stage
+        tasks_by_stage = Tasks._dashboard_aggregate(
+            [], '"project_task".stage_id, COUNT(*), SUM("project_task".effective_hours)', '1')
+        total_hours = sum(hours or 0 for _stage_id, _count, hours in tasks_by_stage)
+
+        return {
+            'total_projects': len(active_projects),
+            'active_tasks': sum(count for stage_id, count, _hours in tasks_by_stage
+                                if not stages.get(stage_id, {}).get('fold')),
+            'total_hours': round(total_hours, 2),
+            'team_members': len(team_members),
+        }
+
+    @api.model
+    def _get_recent_projects(self, dashboard_context=None):
+        """
+        The most recently created active projects, with the statistics of their
+        tasks computed in a single grouped query. The number of projects is set
+        by the ``project_dashboard.recent_projects_count`` system parameter.
+        """
+        env = self.env
+        count = int(env['ir.config_parameter'].sudo().get_param('project_dashboard.recent_projects_count', 5))
+        Project = env['project.project']
+        projects = Project.search_read([('active', '=', True)], ['name'], limit=count, order='create_date desc')
+        if not projects:
+            return []
+
+        # Same tasks as project.task_ids: the field domain applies, and the record rules
+        from_clause, where_clause, params = env['project.task']._dashboard_query(
+            [('project_id', 'in', [project['id'] for project in projects])]
+            + Project._fields['task_ids'].get_domain_list(Project)
+        )
+        env.cr.execute(f"""
+            SELECT "project_task".project_id,
+                   COUNT(*),
+                   COUNT(*) FILTER (WHERE stage.fold),
+                   BOOL_OR("project_task".is_overdue),
+                   SUM("project_task".effective_hours)
+              FROM {from_clause}
+         LEFT JOIN project_task_type stage ON stage.id = "project_task".stage_id
+             WHERE {where_clause}
+          GROUP BY "project_task".project_id
+        """, params)
+        stats = {row[0]: row[1:] for row in env.cr.fetchall()}
+
+        recent_projects = []
+        for project in projects:
+            task_count, completed, overdue, hours = stats.get(project['id'], (0, 0, False, 0.0))
+            status = self._get_project_status(task_count, completed, overdue)
+            recent_projects.append({
+                'name': project['name'],
+                'progress': self._calculate_project_progress(task_count, completed),
+                'tasks': task_count,
+                'hours': round(hours or 0, 2),
+                'status': status,
+                'status_class': self._get_status_class(status)
+            })
+        return recent_projects
+
+    def _calculate_project_progress(self, task_count, completed):
+        if not task_count:
+            return 0
+        return round((completed / task_count) * 100, 2)
+
+    def _get_project_status(self, task_count, completed, overdue):
+        if not task_count:
+            return 'draft'
+        if completed == task_count:
+            return 'completed'
+        if overdue:
+            return 'delayed'
+        return 'in_progress'
+
+    def _get_status_class(self, status):
+        status_classes = {
+            'draft': 'bg-secondary',
+            'completed': 'bg-success',
+            'delayed': 'bg-danger',
+            'in_progress': 'bg-info'
+        }
+        return status_classes.get(status, 'bg-secondary')
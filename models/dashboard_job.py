@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+import json
+import logging
+from datetime import timedelta
+
+from odoo import api, fields, models
+from odoo.tools import date_utils
+
+_logger = logging.getLogger(__name__)
+
+# Age after which the finished and abandoned jobs are deleted
+JOB_RETENTION = timedelta(days=1)
+
+
+class DashboardJob(models.Model):
+    """
+    Dashboard data computed in the background, for the ranges too large to be
+    computed within the request: the client submits the job, the cron
+    computes it as the user who submitted it, and the client fetches the
+    result once notified on the bus (or by polling its state).
+    """
+    _name = 'project_dashboard.job'
+    _description = 'Dashboard Job'
+    _order = 'id desc'
+
+    user_id = fields.Many2one('res.users', 'User', required=True, readonly=True, ondelete='cascade',
+                              default=lambda self: self.env.user)
+    state = fields.Selection([
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ], 'State', default='pending', required=True, readonly=True)
+    parameters = fields.Text('Parameters', required=True, readonly=True)
+    result = fields.Text('Result', readonly=True, prefetch=False)
+    error = fields.Text('Error', readonly=True)
+    date_done = fields.Datetime('Done on', readonly=True)
+
+    @api.model
+    def _cron_run_dashboard_jobs(self):
+        """Run the pending jobs, oldest first, and notify their user of each result."""
+        while True:
+            job = self.search([('state', '=', 'pending')], order='id', limit=1)
+            if not job:
+                return
+            job.state = 'running'
+            self.env.cr.commit()
+
+            try:
+                result = job._run_job()
+            except Exception as e:
+                self.env.cr.rollback()
+                _logger.exception("Dashboard job %s failed", job.id)
+                job.write({'state': 'failed', 'error': str(e), 'date_done': fields.Datetime.now()})
+            else:
+                job.write({
+                    'state': 'done',
+                    'result': json.dumps(result, default=date_utils.json_default),
+                    'date_done': fields.Datetime.now(),
+                })
+            self.env['bus.bus']._sendone(job.user_id.partner_id, 'project_dashboard/job_done', {
+                'job_id': job.id,
+                'state': job.state,
+            })
+            self.env.cr.commit()
+
+    def _run_job(self):
+        """Compute the dashboard data of the job as its user, without widget budget."""
+        self.ensure_one()
+        params = json.loads(self.parameters)
+        Dashboard = self.env['project_dashboard.data']
+        start_date, end_date = Dashboard._parse_date_range(params['start_date'], params['end_date'])
+        widgets = Dashboard._get_dashboard_widgets(
+            start_date, end_date, params['limit'], params['offset'], params['max_points'], params['interval'])
+        if params['widgets']:
+            widgets = {key: compute for key, compute in widgets.items() if key in params['widgets']}
+
+        env = self.env(user=self.user_id.id, context=self.user_id.context_get(), su=False)
+        values = {key: compute(env) for key, compute in widgets.items()}
+        values['data_source'] = 'job'
+        return values
+
+    @api.autovacuum
+    def _gc_dashboard_jobs(self):
+        self.sudo().search([('create_date', '<', fields.Datetime.now() - JOB_RETENTION)]).unlink()
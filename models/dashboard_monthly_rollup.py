@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+
+from odoo import api, fields, models
+
+# Figures pre-aggregated per month, user, employee and project
+ROLLUP_MEASURES = (
+    'timesheet_hours', 'planned_hours', 'task_hours',
+    'completed_early', 'completed_on_time', 'completed_late',
+    'bug_count', 'bug_hours',
+)
+# Models the rows are aggregated from, whose record rules the raw records apply
+ROLLUP_SOURCE_MODELS = ('account.analytic.line', 'project.task')
+
+
+class DashboardMonthlyRollup(models.Model):
+    """
+    Cold-history tier of the dashboard: the figures of the closed months,
+    aggregated per month, user, employee and project, and rebuilt by a daily
+    cron. The dashboard reads these rows for the whole months of its range
+    that are rolled up, and the raw records for the rest (the current month,
+    and the partial months at the bounds of the range).
+
+    Timesheet rows carry the user and employee of the timesheet lines; task
+    rows carry one assignee of the tasks and no employee. Only the records
+    linked to a project are rolled up, and the widgets reading the rollups
+    apply the same filter to the raw records. The rows are aggregated from
+    all the records and are not readable by the users: the widgets only read
+    them when no record rule of the current user restricts the timesheet
+    lines or the tasks, and compute the whole range from the raw records,
+    with the record rules applied, otherwise.
+    """
+    _name = 'project_dashboard.monthly_rollup'
+    _description = 'Dashboard Monthly Rollup'
+    _order = 'month, project_id, user_id'
+    _log_access = False
+
+    month = fields.Date('Month', required=True, index=True, readonly=True)
+    user_id = fields.Many2one('res.users', 'User', readonly=True)
+    employee_id = fields.Many2one('hr.employee', 'Employee', readonly=True)
+    project_id = fields.Many2one('project.project', 'Project', readonly=True, ondelete='cascade')
+    # Timesheet lines dated in the month
+    timesheet_hours = fields.Float('Logged Hours', readonly=True)
+    # Tasks started in the month, per assignee
+    planned_hours = fields.Float('Planned Hours', readonly=True)
+    task_hours = fields.Float('Task Hours', readonly=True)
+    # Tasks folded in the month, per assignee, by their deadline
+    completed_early = fields.Integer('Completed Early', readonly=True)
+    completed_on_time = fields.Integer('Completed On Time', readonly=True)
+    completed_late = fields.Integer('Completed Late', readonly=True)
+    # Bugs resolved in the month
+    bug_count = fields.Integer('Resolved Bugs', readonly=True)
+    bug_hours = fields.Float('Bug Hours', readonly=True)
+
+    @api.model
+    def _get_rolled_up_until(self):
+        """Return the first day of the first month that is not rolled up, or None."""
+        until = self.env['ir.config_parameter'].sudo().get_param('project_dashboard.rollup_until')
+        return fields.Date.to_date(until) if until else None
+
+    @api.model
+    def _can_read_rollups(self):
+        """Whether the rows hold what the current user can read: no record rule filters their sources."""
+        Rule = self.env['ir.rule']
+        return not any(Rule._compute_domain(model, 'read') for model in ROLLUP_SOURCE_MODELS)
+
+    @api.model
+    def _get_span(self, start_date, end_date):
+        """
+        Return the (first, last) datetimes bounding the whole months of the
+        range ``start_date`` to ``end_date`` (inclusive) that are rolled up,
+        ``last`` excluded, or None when there are none or the current user
+        cannot read the rollups.
+        """
+        until = self._get_rolled_up_until()
+        if not until or not self._can_read_rollups():
+            return None
+        first = start_date.date() if isinstance(start_date, datetime) else start_date
+        if first.day != 1:
+            first = (first.replace(day=1) + timedelta(days=32)).replace(day=1)
+        last = end_date.date() if isinstance(end_date, datetime) else end_date
+        last = min((last + timedelta(days=1)).replace(day=1), until)
+        if first >= last:
+            return None
+        return datetime.combine(first, time.min), datetime.combine(last, time.min)
+
+    @api.model
+    def _read_span(self, span, measures):
+        """
+        Return the rows of the months of ``span``, with their ``month`` as a
+        datetime. The rows are read as superuser: ``span`` comes from
+        :meth:`_get_span`, which only returns one when the user can read them.
+        """
+        rows = self.sudo().search_read([
+            ('month', '>=', span[0].date()),
+            ('month', '<', span[1].date()),
+        ], ['month', 'user_id', 'employee_id', 'project_id'] + list(measures), load=None)
+        for row in rows:
+            row['month'] = datetime.combine(row['month'], time.min)
+        return rows
+
+    @api.model
+    def _cron_rollup_closed_months(self):
+        """
+        Rebuild the rows of all the closed months. The records of a closed
+        month still change (late timesheets, estimates and hours of the tasks,
+        reopened, archived or deleted tasks), and the old values of the records
+        are not known: every closed month is thus recomputed, in one grouped
+        query per measure over the whole history.
+        """
+        current_month = fields.Date.today().replace(day=1)
+        self._rollup_months(current_month)
+        self.env['ir.config_parameter'].sudo().set_param(
+            'project_dashboard.rollup_until', fields.Date.to_string(current_month))
+
+    @api.model
+    def _rollup_months(self, until):
+        """Replace the rows of the months before ``until`` (a date, first day of a month) by their figures."""
+        self.env.flush_all()
+        until_datetime = datetime.combine(until, time.min)
+        values = defaultdict(lambda: dict.fromkeys(ROLLUP_MEASURES, 0))
+        cr = self.env.cr
+
+        cr.execute("""
+            SELECT date_trunc('month', date)::date, user_id, employee_id, project_id, SUM(unit_amount)
+              FROM account_analytic_line
+             WHERE project_id IS NOT NULL AND date < %s
+          GROUP BY 1, user_id, employee_id, project_id
+        """, [until])
+        for month, user_id, employee_id, project_id, hours in cr.fetchall():
+            values[month, user_id, employee_id, project_id]['timesheet_hours'] = hours or 0.0
+
+        # Active tasks only, as the dashboard searches them
+        cr.execute("""
+            SELECT date_trunc('month', task.task_start_date)::date, rel.user_id, task.project_id,
+                   SUM(task.planned_hours), SUM(task.actual_hours)
+              FROM project_task task
+              JOIN project_task_user_rel rel ON rel.task_id = task.id
+             WHERE task.active AND task.project_id IS NOT NULL AND task.task_start_date < %s
+          GROUP BY 1, rel.user_id, task.project_id
+        """, [until_datetime])
+        for month, user_id, project_id, planned_hours, task_hours in cr.fetchall():
+            row = values[month, user_id, None, project_id]
+            row['planned_hours'] = planned_hours or 0.0
+            row['task_hours'] = task_hours or 0.0
+
+        cr.execute("""
+            SELECT date_trunc('month', task.date_last_stage_update)::date, rel.user_id, task.project_id,
+                   COUNT(*) FILTER (WHERE task.date_deadline::timestamp > task.date_last_stage_update),
+                   COUNT(*) FILTER (WHERE task.date_deadline::timestamp = task.date_last_stage_update),
+                   COUNT(*) FILTER (WHERE task.date_deadline::timestamp < task.date_last_stage_update)
+              FROM project_task task
+              JOIN project_task_user_rel rel ON rel.task_id = task.id
+              JOIN project_task_type stage ON stage.id = task.stage_id
+             WHERE task.active AND task.project_id IS NOT NULL AND stage.fold
+               AND task.date_deadline IS NOT NULL AND task.date_last_stage_update < %s
+          GROUP BY 1, rel.user_id, task.project_id
+        """, [until_datetime])
+        for month, user_id, project_id, early, on_time, late in cr.fetchall():
+            row = values[month, user_id, None, project_id]
+            row.update(completed_early=early, completed_on_time=on_time, completed_late=late)
+
+        cr.execute("""
+            SELECT date_trunc('month', task.bug_resolution_date)::date, task.project_id,
+                   COUNT(*), SUM(task.actual_hours)
+              FROM project_task task
+             WHERE task.active AND task.project_id IS NOT NULL AND task.is_bug
+               AND task.bug_resolution_date < %s
+          GROUP BY 1, task.project_id
+        """, [until_datetime])
+        for month, project_id, bug_count, bug_hours in cr.fetchall():
+            row = values[month, None, None, project_id]
+            row.update(bug_count=bug_count, bug_hours=bug_hours or 0.0)
+
+        self.sudo().search([('month', '<', until)]).unlink()
+        self.sudo().create([
+            dict(row, month=month, user_id=user_id, employee_id=employee_id, project_id=project_id)
+            for (month, user_id, employee_id, project_id), row in values.items()
+        ])
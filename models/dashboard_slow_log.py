@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+import json
+
+import psycopg2
+
+from odoo import api, fields, models
+
+
+class DashboardSlowLog(models.Model):
+    _name = 'project_dashboard.slow_log'
+    _description = 'Dashboard Slow Widget'
+    _order = 'create_date desc, id desc'
+    _rec_name = 'widget'
+
+    widget = fields.Char('Widget', required=True, readonly=True)
+    user_id = fields.Many2one('res.users', 'User', readonly=True)
+    duration_ms = fields.Float('Duration (ms)', readonly=True)
+    query_count = fields.Integer('Queries', readonly=True)
+    sql_time_ms = fields.Float('SQL Time (ms)', readonly=True)
+    parameters = fields.Text('Parameters', readonly=True)
+    statements = fields.Text('SQL Statements', readonly=True)
+    slowest_query = fields.Text('Slowest Query', readonly=True)
+    query_plan = fields.Text('Query Plan', readonly=True)
+
+    @api.model
+    def _log_slow_widget(self, widget, user_id, stats, statements, parameters):
+        """
+        Store a slow widget computation with the SQL it ran (``statements`` is
+        a list of (sql, duration in seconds) pairs), and the
+        EXPLAIN (ANALYZE, BUFFERS) of its slowest read-only statement.
+        """
+        readonly = [(query, duration) for query, duration in statements
+                    if query.lstrip().upper().startswith(('SELECT', 'WITH'))]
+        slowest_query = max(readonly, key=lambda statement: statement[1])[0] if readonly else False
+        return self.create({
+            'widget': widget,
+            'user_id': user_id,
+            'duration_ms': round(stats['time'] * 1000, 1),
+            'query_count': stats['queries'],
+            'sql_time_ms': round(stats['sql_time'] * 1000, 1),
+            'parameters': json.dumps(parameters, indent=2, default=str),
+            'statements': '\n\n'.join(f"-- {duration * 1000:.1f} ms\n{query};" for query, duration in statements),
+            'slowest_query': slowest_query,
+            'query_plan': slowest_query and self._explain(slowest_query),
+        })
+
+    def _explain(self, query):
+        try:
+            with self.env.cr.savepoint(flush=False):
+                self.env.cr.execute(f"EXPLAIN (ANALYZE, BUFFERS) {query}")
+                return '\n'.join(row[0] for row in self.env.cr.fetchall())
+        except psycopg2.Error as e:
+            return f"EXPLAIN failed: {e}"
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+from odoo import models
+from odoo.http import request
+
+from odoo.addons.project_dashboard.controllers import instrumentation
+
+DASHBOARD_DATA_ROUTE = '/project/dashboard/data'
+
+
+class IrHttp(models.AbstractModel):
+    _inherit = 'ir.http'
+
+    @classmethod
+    def _post_dispatch(cls, response):
+        super()._post_dispatch(response)
+        if request.httprequest.path == DASHBOARD_DATA_ROUTE:
+            # Size of the response as serialized for the client, without serializing the data again
+            instrumentation.payload_bytes.observe(len(response.get_data()))
+            instrumentation.dump_metrics()
@@ -1,9 +1,83 @@
+import bisect
+
 from odoo import models, fields, api
+from odoo.tools.sql import create_index
 from datetime import datetime, timedelta
 from collections import defaultdict
 
 from odoo.odoo.http import request
 
+from .dashboard_context import DashboardContext
+
+# Number of bars returned by the paginated high-cardinality widgets
+DASHBOARD_TOP_N = 15
+
+# Time intervals of the dashboard series, from the finest to the coarsest
+DASHBOARD_INTERVALS = ('day', 'week', 'month')
+
+# Join of the assignees of the tasks, aliased rel, in the grouped queries of the widgets
+TASK_ASSIGNEES_JOIN = 'JOIN project_task_user_rel rel ON rel.task_id = "project_task".id'
+
+# Dashboard widgets to refresh when records of each model change
+DASHBOARD_WIDGET_SOURCES = {
+    'project.project': ('summary', 'recent_projects', 'project_progress', 'task_overruns'),
+    'project.task': (
+        'summary', 'weekly_developer_utilization', 'task_distribution', 'bug_resolution', 'capacity_allocation',
+        'recent_projects', 'task_completion', 'project_progress', 'task_overruns', 'weekly_burn_rate',
+        'task_backlog',
+    ),
+    'account.analytic.line': (
+        'summary', 'weekly_developer_utilization', 'recent_projects', 'timesheet_compliance',
+    ),
+}
+
+
+
+def lttb_indices(values, threshold):
+    """
+    Return the indices of the points of ``values`` kept by the
+    Largest-Triangle-Three-Buckets downsampling to ``threshold`` points.
+    """
+    size = len(values)
+    if threshold >= size or threshold < 3:
+        return list(range(size))
+
+    every = (size - 2) / (threshold - 2)
+    indices = [0]
+    previous = 0
+    for i in range(threshold - 2):
+        # Average point of the next bucket
+        next_start = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, size)
+        average_x = (next_start + next_end - 1) / 2
+        average_y = sum(values[next_start:next_end]) / (next_end - next_start)
+
+        # Point of the current bucket forming the largest triangle with the
+        # previous point kept and the average of the next bucket
+        best, best_area = None, -1
+        for j in range(int(i * every) + 1, int((i + 1) * every) + 1):
+            area = abs((previous - average_x) * (values[j] - values[previous])
+                       - (previous - j) * (average_y - values[previous]))
+            if area > best_area:
+                best, best_area = j, area
+        indices.append(best)
+        previous = best
+    indices.append(size - 1)
+    return indices
+
+
+def downsample_series(labels, series, max_points):
+    """
+    Decimate the ``labels`` and every list of ``series`` sharing them to
+    ``max_points`` points, picked by LTTB on their sum so that the peaks of the
+    aggregate survive.
+    """
+    if len(labels) <= max_points:
+        return labels, series
+    totals = [sum(values) for values in zip(*series)] if series else [0] * len(labels)
+    indices = lttb_indices(totals, max_points)
+    return [labels[i] for i in indices], [[values[i] for i in indices] for values in series]
+
 
 class ProjectTask(models.Model):
     _inherit = 'project.task'
@@ -38,7 +112,7 @@ class ProjectTask(models.Model):
     def _compute_is_overdue(self):
         for task in self:
             if task.task_end_date and task.date_deadline:
-                task.is_overdue = task.task_end_date > task.date_deadline
+                task.is_overdue = task.task_end_date.date() > task.date_deadline
             else:
                 task.is_overdue = False
 
@@ -68,10 +142,11 @@ class ProjectTask(models.Model):
         }
         return colors.get(type, colors['primary'])
 
-    def _get_weekly_developer_utilization(self, start_date, end_date):
-        employees = self.env['hr.employee'].search([('active', '=', True)])
-        colors = self._get_chart_colors()
-        secondary_colors = self._get_chart_colors('secondary')
+    def _get_weekly_developer_utilization(self, start_date, end_date, dashboard_context=None):
+        dashboard_context = dashboard_context or DashboardContext()
+        employees = dashboard_context.employees(self.env)
+        colors = dashboard_context.colors(self.env)
+        secondary_colors = dashboard_context.colors(self.env, 'secondary')
 
         data = {
             'labels': [],
@@ -103,24 +178,50 @@ class ProjectTask(models.Model):
             ]
         }
 
-        for employee in employees:
-            user = self.env['res.users'].search([('employee_id', '=', employee.id)], limit=1)
-            data['labels'].append(employee.name)
+        # Estimated hours per user and logged hours per employee, each read in one grouped query
+        estimated_by_user = defaultdict(float)
+        # Only the records of a project, as the monthly rollups
+        task_domain = [
+            ('user_ids', 'in', [employee['user_id'] for employee in employees if employee['user_id']]),
+            ('project_id', '!=', False),
+            ('task_start_date', '>=', start_date),
+            ('task_start_date', '<=', end_date)
+        ]
+        logged_by_employee = defaultdict(float)
+        timesheet_domain = [
+            ('employee_id', 'in', [employee['id'] for employee in employees]),
+            ('project_id', '!=', False),
+            ('date', '>=', start_date),
+            ('date', '<=', end_date)
+        ]
 
-            tasks = self.env['project.task'].search([
-                ('user_ids', 'in', [user.id]) if user else ('id', '=', False),
-                ('task_start_date', '>=', start_date),
-                ('task_start_date', '<=', end_date)
-            ])
+        # Whole closed months from the rollups, the rest of the range from the records
+        span = self.env['project_dashboard.monthly_rollup']._get_span(start_date, end_date)
+        if span:
+            task_domain += self._exclude_rollup_span('task_start_date', span)
+            timesheet_domain += self._exclude_rollup_span('date', (span[0].date(), span[1].date()))
+            Rollup = self.env['project_dashboard.monthly_rollup']
+            for row in Rollup._read_span(span, ['planned_hours', 'timesheet_hours']):
+                if row['employee_id']:
+                    logged_by_employee[row['employee_id']] += row['timesheet_hours']
+                if row['user_id']:
+                    estimated_by_user[row['user_id']] += row['planned_hours']
+
+        for user_id, planned_hours in self._dashboard_aggregate(
+                task_domain, 'rel.user_id, SUM("project_task".planned_hours)', 'rel.user_id',
+                join=TASK_ASSIGNEES_JOIN):
+            estimated_by_user[user_id] += planned_hours or 0.0
+
+        for employee_id, hours in self._dashboard_aggregate(
+                timesheet_domain, '"account_analytic_line".employee_id, SUM("account_analytic_line".unit_amount)',
+                '"account_analytic_line".employee_id', model='account.analytic.line'):
+            logged_by_employee[employee_id] += hours or 0.0
 
-            estimated_hours = sum(tasks.mapped('planned_hours'))
+        for employee in employees:
+            data['labels'].append(employee['name'])
 
-            timesheets = self.env['account.analytic.line'].search([
-                ('employee_id', '=', employee.id),
-                ('date', '>=', start_date),
-                ('date', '<=', end_date)
-            ])
-            logged_hours = sum(timesheets.mapped('unit_amount'))
+            estimated_hours = estimated_by_user[employee['user_id']] if employee['user_id'] else 0.0
+            logged_hours = logged_by_employee[employee['id']]
 
             utilization_percentage = (logged_hours / estimated_hours * 100) if estimated_hours else 0
 
@@ -130,7 +231,7 @@ class ProjectTask(models.Model):
 
         return data
 
-    def _get_task_distribution(self, start_date=False, end_date=False, _logger=None):
+    def _get_task_distribution(self, start_date=False, end_date=False, dashboard_context=None):
         """
         Get task type distribution breakdown for each developer
         """
@@ -145,94 +246,99 @@ class ProjectTask(models.Model):
         if isinstance(end_date, str):
             end_date = fields.Date.from_string(end_date)
 
-        developers = self.env['res.users'].search([
-            ('share', '=', False),
-            ('active', '=', True)
-        ])
+        dashboard_context = dashboard_context or DashboardContext()
+        developers = dashboard_context.users(self.env)
 
-        colors = self._get_chart_colors()
+        colors = dashboard_context.colors(self.env)
         data = []
 
-        # Get all unique task types first
-        all_task_types = self.env['project.task'].search([
+        # Hours per assignee and task type (unassigned tasks included for their type)
+        rows = self._dashboard_aggregate([
             ('create_date', '>=', start_date),
             ('create_date', '<=', end_date)
-        ]).mapped('task_type')
-        all_task_types = list(set(all_task_types))  # Remove duplicates
+        ], 'rel.user_id, "project_task".task_type, SUM("project_task".actual_hours)',
+            'rel.user_id, "project_task".task_type', join='LEFT ' + TASK_ASSIGNEES_JOIN)
+
+        # Get all unique task types first
+        all_task_types = list({task_type for _user_id, task_type, _hours in rows})  # Remove duplicates
+
+        # Hours per developer and task type
+        hours_by_developer = defaultdict(lambda: defaultdict(float))
+        for user_id, task_type, hours in rows:
+            if user_id:
+                hours_by_developer[user_id][task_type] += hours or 0.0
 
         for dev in developers:
-            try:
-                tasks = self.env['project.task'].search([
-                    ('user_ids', 'in', [dev.id]),
-                    ('create_date', '>=', start_date),
-                    ('create_date', '<=', end_date)
-                ])
-
-                if not tasks:
-                    continue
-
-                categories = []
-                for index, task_type in enumerate(all_task_types):
-                    type_tasks = tasks.filtered(lambda t: t.task_type == task_type)
-                    hours = sum(type_tasks.mapped('actual_hours') or [0.0])
-
-                    if hours > 0:  # Only add categories with hours
-                        categories.append({
-                            'type': task_type or 'Undefined',
-                            'hours': float(hours),
-                            'color': colors[index % len(colors)]
-                        })
-
-                if categories:  # Only add developer if they have task hours
-                    data.append({
-                        'developer': dev.name,
-                        'categories': categories
-                    })
-            except Exception as e:
-                _logger.error(f"Error processing developer {dev.name}: {str(e)}")
+            if dev['id'] not in hours_by_developer:
                 continue
 
+            categories = []
+            for index, task_type in enumerate(all_task_types):
+                hours = hours_by_developer[dev['id']].get(task_type, 0.0)
+
+                if hours > 0:  # Only add categories with hours
+                    categories.append({
+                        'type': task_type or 'Undefined',
+                        'hours': float(hours),
+                        'color': colors[index % len(colors)]
+                    })
+
+            if categories:  # Only add developer if they have task hours
+                data.append({
+                    'developer': dev['name'],
+                    'categories': categories
+                })
+
         return data
 
-    def _get_bug_resolution_data(self, start_date, end_date, interval):
-        end_date = fields.Datetime.now()
-        start_date = end_date - timedelta(weeks=12)
-        colors = self._get_chart_colors()
+    def _get_bug_resolution_data(self, start_date, end_date, interval, max_points=None, dashboard_context=None):
+        """Hours spent on the bugs resolved in each interval of the period, oldest first."""
+        dashboard_context = dashboard_context or DashboardContext()
+        colors = dashboard_context.colors(self.env)
+        interval, buckets = self._get_dashboard_buckets(start_date, end_date, interval, max_points)
+        bucket_starts = [bucket_start for _label, bucket_start, _end in buckets]
 
-        bug_tasks = self.search([
+        hours = [0.0] * len(buckets)
+        domain = [
             ('is_bug', '=', True),
-            ('bug_resolution_date', '>=', start_date),
-            ('bug_resolution_date', '<=', end_date)
-        ])
+            ('project_id', '!=', False),
+            ('bug_resolution_date', '>=', buckets[0][1]),
+            ('bug_resolution_date', '<', buckets[-1][2])
+        ]
+        span = self._get_dashboard_rollup_span(buckets, interval)
+        if span:
+            domain += self._exclude_rollup_span('bug_resolution_date', span)
+            for row in self.env['project_dashboard.monthly_rollup']._read_span(span, ['bug_hours']):
+                hours[bisect.bisect_right(bucket_starts, row['month']) - 1] += row['bug_hours']
+        for bucket_start, bug_hours in self._dashboard_aggregate(
+                domain, f'date_trunc(\'{interval}\', "project_task".bug_resolution_date), '
+                        'SUM("project_task".actual_hours)', '1'):
+            hours[bisect.bisect_right(bucket_starts, bucket_start) - 1] += bug_hours or 0.0
+
+        labels = [label for label, _start, _end in buckets]
+        if max_points:
+            labels, (hours,) = downsample_series(labels, [hours], max_points)
 
         data = {
-            'labels': [end_date - timedelta(weeks=i) for i in range(12)],
+            'labels': labels,
+            'interval': interval,
             'datasets': [{
                 'label': 'Bug Resolution Time',
-                'data': [
-                    sum(bug_tasks.filtered(
-                        lambda t: t.bug_resolution_date >= start_date + timedelta(weeks=i) and
-                                t.bug_resolution_date < start_date + timedelta(weeks=i + 1)
-                    ).mapped('actual_hours'))
-                    for i in range(12)
-                ],
+                'data': hours,
                 'borderColor': colors[0],
-                'backgroundColor': self._get_chart_colors('secondary')[0],
+                'backgroundColor': dashboard_context.colors(self.env, 'secondary')[0],
                 'tension': 0.1
             }]
         }
         return data
 
-
-    def _get_task_completion_data(self, start_date=None, end_date=None):
+    def _get_task_completion_data(self, start_date=None, end_date=None, dashboard_context=None):
+        dashboard_context = dashboard_context or DashboardContext()
         # Get all developers (users) who are not portal/public users
-        developers = self.env['res.users'].search([
-            ('share', '=', False),
-            ('active', '=', True)
-        ])
+        developers = dashboard_context.users(self.env)
 
-        colors = self._get_chart_colors()
-        secondary_colors = self._get_chart_colors('secondary')
+        colors = dashboard_context.colors(self.env)
+        secondary_colors = dashboard_context.colors(self.env, 'secondary')
 
         data = {
             'labels': [],
@@ -268,125 +374,214 @@ class ProjectTask(models.Model):
 
         # Add all developers to labels first
         for dev in developers:
-            data['labels'].append(dev.name)
+            data['labels'].append(dev['name'])
 
         # Initialize data arrays with zeros for all developers
         for dataset in data['datasets']:
             dataset['data'] = [0] * len(developers)
 
         # Now populate the data for developers who have tasks
-        for i, dev in enumerate(developers):
-            tasks = self.search([
-                ('user_ids', 'in', [dev.id]),
-                ('stage_id.fold', '=', True),
-                ('date_last_stage_update', '>=', start_date),
-                ('date_last_stage_update', '<=', end_date)
-            ])
-
-            early = 0
-            on_time = 0
-            late = 0
-
-            for task in tasks:
-                if task.date_deadline and task.date_last_stage_update:
-                    deadline = fields.Datetime.to_datetime(task.date_deadline)
-                    last_update = fields.Datetime.to_datetime(task.date_last_stage_update)
-
-                    if deadline > last_update:
-                        early += 1
-                    elif deadline == last_update:
-                        on_time += 1
-                    else:
-                        late += 1
-
-            # Update data at the correct index for this developer
-            data['datasets'][0]['data'][i] = early
-            data['datasets'][1]['data'][i] = on_time
-            data['datasets'][2]['data'][i] = late
+        index_by_developer = {dev['id']: i for i, dev in enumerate(developers)}
+        domain = [
+            ('user_ids', 'in', list(index_by_developer)),
+            ('project_id', '!=', False),
+            ('stage_id.fold', '=', True),
+            ('date_last_stage_update', '>=', start_date),
+            ('date_last_stage_update', '<=', end_date)
+        ]
+        # Whole closed months from the rollups, the rest of the range from the tasks
+        span = self.env['project_dashboard.monthly_rollup']._get_span(start_date, end_date)
+        if span:
+            domain += self._exclude_rollup_span('date_last_stage_update', span)
+            measures = ['completed_early', 'completed_on_time', 'completed_late']
+            for row in self.env['project_dashboard.monthly_rollup']._read_span(span, measures):
+                if row['user_id'] in index_by_developer:
+                    for dataset, measure in enumerate(measures):
+                        data['datasets'][dataset]['data'][index_by_developer[row['user_id']]] += row[measure]
+        # Early, on time and late tasks per assignee, the tasks without deadline are not counted
+        rows = self._dashboard_aggregate(domain, """
+            rel.user_id,
+            COUNT(*) FILTER (WHERE "project_task".date_deadline::timestamp > "project_task".date_last_stage_update),
+            COUNT(*) FILTER (WHERE "project_task".date_deadline::timestamp = "project_task".date_last_stage_update),
+            COUNT(*) FILTER (WHERE "project_task".date_deadline::timestamp < "project_task".date_last_stage_update)
+        """, 'rel.user_id', join=TASK_ASSIGNEES_JOIN)
+
+        for user_id, *counts in rows:
+            # Update data at the correct index for each developer
+            if user_id in index_by_developer:
+                for dataset, count in enumerate(counts):
+                    data['datasets'][dataset]['data'][index_by_developer[user_id]] += count
 
         return data
 
-    def _get_project_progress_data(self):
-        # Get all active projects
-        all_projects = self.env['project.project'].search([('active', '=', True)])
+    def _dashboard_query(self, domain, model=None):
+        """
+        Return the (from_clause, where_clause, params) triple of ``domain`` on
+        ``model`` (defaults to this model) with the record rules applied, so the
+        dashboard aggregations can run as grouped SQL without bypassing access rights.
+        """
+        Model = self.env[model] if model else self
+        query = Model._where_calc(domain)
+        Model._apply_ir_rules(query, 'read')
+        from_clause, where_clause, params = query.get_sql()
+        return from_clause, where_clause or 'TRUE', params
 
-        # Get all tasks
-        domain = [
-            ('project_id', 'in', all_projects.ids),
-            ('active', '=', True)
-        ]
+    def _dashboard_aggregate(self, domain, select, group_by=None, join='', model=None):
+        """
+        Return the rows of the ``select`` expressions over the records of
+        ``domain`` on ``model`` (defaults to this model), grouped by
+        ``group_by``, with the record rules applied. Only the selected columns
+        are read, so the memory used is proportional to the result rather than
+        to the records. The table is referred to by its quoted name (e.g.
+        "project_task"), ``join`` adds joins to it.
+        """
+        from_clause, where_clause, params = self._dashboard_query(domain, model)
+        group_by_clause = f"GROUP BY {group_by}" if group_by else ''
+        self.env.cr.execute(f"""
+            SELECT {select}
+              FROM {from_clause} {join}
+             WHERE {where_clause}
+             {group_by_clause}
+        """, params)
+        return self.env.cr.fetchall()
+
+    def _get_project_progress_data(self, limit=None, offset=0, dashboard_context=None):
+        """
+        Get completed/remaining task counts per active project, ranked by task count.
 
-        all_tasks = self.env['project.task'].search(domain)
+        Only one page of ``limit`` projects starting at ``offset`` is returned; the
+        projects ranked after that page are merged into a single "Other" bucket.
+        """
+        limit = limit or DASHBOARD_TOP_N
+        dashboard_context = dashboard_context or DashboardContext()
+        from_clause, where_clause, params = self._dashboard_query([
+            ('project_id.active', '=', True),
+        ])
+        self.env.cr.execute(f"""
+            WITH stats AS (
+                SELECT "project_task".project_id AS project_id,
+                       COUNT(*) AS total,
+                       COUNT(*) FILTER (WHERE stage.fold) AS completed
+                  FROM {from_clause}
+             LEFT JOIN project_task_type stage ON stage.id = "project_task".stage_id
+                 WHERE {where_clause}
+              GROUP BY "project_task".project_id
+            ), ranked AS (
+                SELECT project_id, total, completed,
+                       ROW_NUMBER() OVER (ORDER BY total DESC, project_id) AS rank,
+                       COUNT(*) OVER () AS project_count
+                  FROM stats
+            )
+            SELECT project_id, total, completed, rank, project_count
+              FROM ranked
+             WHERE rank > %s AND rank <= %s
+             UNION ALL
+            SELECT NULL, SUM(total)::int, SUM(completed)::int, NULL, MAX(project_count)
+              FROM ranked
+             WHERE rank > %s
+          ORDER BY rank NULLS LAST
+        """, params + [offset, offset + limit, offset + limit])
+        rows = self.env.cr.fetchall()
+
+        page = [row for row in rows if row[3]]
+        other = next((row for row in rows if not row[3] and row[1]), None)
+        projects = dashboard_context.projects(self.env)
+        names = {row[0]: projects[row[0]]['name'] for row in page if row[0] in projects}
 
         data = {
             'labels': [],
             'completed': [],
             'remaining': [],
             'percentages': [],
-            'total_tasks': []
+            'total_tasks': [],
+            'offset': offset,
+            'limit': limit,
+            'total_count': next((row[4] for row in rows if row[4]), 0),
         }
+        buckets = [(names.get(row[0]), row[1], row[2]) for row in page]
+        if other:
+            buckets.append(('Other', other[1], other[2]))
 
-        # Group tasks by project
-        tasks_by_project = {}
-        for task in all_tasks:
-            if task.project_id not in tasks_by_project:
-                tasks_by_project[task.project_id] = {
-                    'total': 0,
-                    'completed': 0
-                }
-            tasks_by_project[task.project_id]['total'] += 1
-            if task.stage_id.fold:  # Check if task is in a folded stage (completed)
-                tasks_by_project[task.project_id]['completed'] += 1
-
-        # Prepare data for each project
-        for project in all_projects:
-            project_stats = tasks_by_project.get(project, {'total': 0, 'completed': 0})
-            total_tasks = project_stats['total']
-
-            if total_tasks > 0:
-                completed_tasks = project_stats['completed']
-                remaining_tasks = total_tasks - completed_tasks
-                completion_percentage = round((completed_tasks / total_tasks) * 100)
-
-                data['labels'].append(project.name)
-                data['completed'].append(completed_tasks)
-                data['remaining'].append(remaining_tasks)
-                data['percentages'].append(completion_percentage)
-                data['total_tasks'].append(total_tasks)
+        for label, total_tasks, completed_tasks in buckets:
+            data['labels'].append(label)
+            data['completed'].append(completed_tasks)
+            data['remaining'].append(total_tasks - completed_tasks)
+            data['percentages'].append(round((completed_tasks / total_tasks) * 100))
+            data['total_tasks'].append(total_tasks)
 
         return data
 
-    def _get_task_overruns_data(self):
-        tasks = self.search([])
-        colors = self._get_chart_colors()
-        secondary_colors = self._get_chart_colors('secondary')
-        overrun_data = {}
-
-        for task in tasks:
-            if task.effective_hours > task.planned_hours:
-                overrun = task.effective_hours - task.planned_hours
-                if task.user_ids:
-                    for user in task.user_ids:
-                        key = f"{user.name} ({task.project_id.name})"
-                        if key not in overrun_data:
-                            overrun_data[key] = {'count': 0, 'overrun_hours': 0.0}
-                        overrun_data[key]['count'] += 1
-                        overrun_data[key]['overrun_hours'] += overrun
-                else:
-                    key = task.project_id.name
-                    if key not in overrun_data:
-                        overrun_data[key] = {'count': 0, 'overrun_hours': 0.0}
-                    overrun_data[key]['count'] += 1
-                    overrun_data[key]['overrun_hours'] += overrun
-
-        total_tasks = sum(data['count'] for data in overrun_data.values())
-        total_overrun_hours = sum(data['overrun_hours'] for data in overrun_data.values())
+    def _get_task_overruns_data(self, limit=None, offset=0, dashboard_context=None):
+        """
+        Get overrun task counts per "user (project)" pair (per project for unassigned
+        tasks), ranked by count. Pagination and the "Other" bucket work as in
+        `_get_project_progress_data`; the summary always covers every pair.
+        """
+        limit = limit or DASHBOARD_TOP_N
+        dashboard_context = dashboard_context or DashboardContext()
+        colors = dashboard_context.colors(self.env)
+        secondary_colors = dashboard_context.colors(self.env, 'secondary')
+
+        from_clause, where_clause, params = self._dashboard_query([])
+        self.env.cr.execute(f"""
+            WITH overruns AS (
+                SELECT rel.user_id AS user_id,
+                       "project_task".project_id AS project_id,
+                       COUNT(*) AS task_count,
+                       SUM("project_task".effective_hours - "project_task".planned_hours) AS overrun_hours
+                  FROM {from_clause}
+             LEFT JOIN project_task_user_rel rel ON rel.task_id = "project_task".id
+                 WHERE {where_clause}
+                   AND "project_task".effective_hours > "project_task".planned_hours
+              GROUP BY rel.user_id, "project_task".project_id
+            ), ranked AS (
+                SELECT user_id, project_id, task_count, overrun_hours,
+                       ROW_NUMBER() OVER (ORDER BY task_count DESC, overrun_hours DESC,
+                                                   user_id, project_id) AS rank,
+                       COUNT(*) OVER () AS group_count,
+                       (SUM(task_count) OVER ())::int AS total_tasks,
+                       SUM(overrun_hours) OVER () AS total_hours
+                  FROM overruns
+            )
+            SELECT user_id, project_id, task_count, overrun_hours, rank,
+                   group_count, total_tasks, total_hours
+              FROM ranked
+             WHERE rank > %s AND rank <= %s
+             UNION ALL
+            SELECT NULL, NULL, SUM(task_count)::int, SUM(overrun_hours), NULL,
+                   MAX(group_count), MAX(total_tasks), MAX(total_hours)
+              FROM ranked
+             WHERE rank > %s
+          ORDER BY rank NULLS LAST
+        """, params + [offset, offset + limit, offset + limit])
+        rows = self.env.cr.fetchall()
+
+        page = [row for row in rows if row[4]]
+        other = next((row for row in rows if not row[4] and row[2]), None)
+        group_count, total_tasks, total_overrun_hours = next(
+            (row[5:8] for row in rows if row[5]), (0, 0, 0.0))
+
+        # Names from the shared context, the portal users and archived projects are read on demand
+        users = {user['id']: user['name'] for user in dashboard_context.users(self.env)}
+        projects = {project_id: project['name'] for project_id, project in dashboard_context.projects(self.env).items()}
+        missing_users = {row[0] for row in page if row[0] and row[0] not in users}
+        users.update(self.env['res.users'].browse(missing_users).name_get())
+        missing_projects = {row[1] for row in page if row[1] and row[1] not in projects}
+        projects.update(self.env['project.project'].browse(missing_projects).name_get())
+
+        labels = []
+        overrun_count_data = []
+        for user_id, project_id, task_count, _overrun_hours, *_ in page:
+            project_name = projects.get(project_id, False)
+            labels.append(f"{users[user_id]} ({project_name})" if user_id else project_name)
+            overrun_count_data.append(task_count)
+        if other:
+            labels.append('Other')
+            overrun_count_data.append(other[2])
 
-        labels = list(overrun_data.keys())
-        overrun_count_data = [data['count'] for data in overrun_data.values()]
         overrun_percentage_data = [
-            round((data['count'] / total_tasks) * 100, 1) if total_tasks else 0
-            for data in overrun_data.values()
+            round((count / total_tasks) * 100, 1) if total_tasks else 0
+            for count in overrun_count_data
         ]
 
         data = {
@@ -412,36 +607,43 @@ class ProjectTask(models.Model):
 
         return {
             'data': data,
+            'offset': offset,
+            'limit': limit,
+            'total_count': group_count,
             'summary': {
-                'total_overrun_tasks': len(overrun_data),
+                'total_overrun_tasks': group_count,
                 'total_overrun_hours': round(total_overrun_hours, 2),
                 'avg_overrun_percentage': round(total_overrun_hours / total_tasks * 100, 2) if total_tasks else 0
             }
         }
 
-    def _get_timesheet_compliance_data(self):
-        developers = self.env['res.users'].search([('share', '=', False)])
-        colors = self._get_chart_colors()
-        secondary_colors = self._get_chart_colors('secondary')
+    def _get_timesheet_compliance_data(self, dashboard_context=None):
+        dashboard_context = dashboard_context or DashboardContext()
+        developers = dashboard_context.user_ids(self.env)
+        colors = dashboard_context.colors(self.env)
+        secondary_colors = dashboard_context.colors(self.env, 'secondary')
         current_date = fields.Date.today()
         start_date = current_date - timedelta(days=30)
 
         on_time_count = delayed_count = missing_count = 0
 
+        # Distinct timesheet days per developer, from a single grouped query
+        days_by_developer = dict(self._dashboard_aggregate([
+            ('user_id', 'in', developers),
+            ('project_id', '!=', False),
+            ('date', '>=', start_date),
+            ('date', '<=', current_date)
+        ], '"account_analytic_line".user_id, COUNT(DISTINCT "account_analytic_line".date)',
+            '"account_analytic_line".user_id', model='account.analytic.line'))
+
+        expected_days = len(self._get_working_days(start_date, current_date))
+
         for developer in developers:
-            timesheet_entries = self.env['account.analytic.line'].search([
-                ('user_id', '=', developer.id),
-                ('project_id', '!=', False),
-                ('date', '>=', start_date),
-                ('date', '<=', current_date)
-            ])
-
-            if not timesheet_entries:
+            if developer not in days_by_developer:
                 missing_count += 1
                 continue
 
-            expected_days = len([d for d in self._get_working_days(start_date, current_date)])
-            actual_days = len(set(timesheet_entries.mapped('date')))
+            actual_days = days_by_developer[developer]
             compliance_rate = actual_days / expected_days if expected_days else 0
 
             if compliance_rate >= 0.9:
@@ -478,26 +680,21 @@ class ProjectTask(models.Model):
             current += timedelta(days=1)
         return working_days
 
-    def _get_weekly_burn_rate_data(self, start_date, end_date, interval):
-        total_weeks = (end_date - start_date).days // 7
-        developers = self.env['res.users'].search([('share', '=', False)])
-        weeks = [(start_date + timedelta(weeks=i)).strftime('%W') for i in range(total_weeks)]
-        colors = self._get_chart_colors()
-        secondary_colors = self._get_chart_colors('secondary')
+    def _get_weekly_burn_rate_data(self, start_date, end_date, interval, max_points=None, dashboard_context=None):
+        dashboard_context = dashboard_context or DashboardContext()
+        developers = dashboard_context.users(self.env)
+        interval, buckets = self._get_dashboard_buckets(start_date, end_date, interval, max_points)
+        colors = dashboard_context.colors(self.env)
+        secondary_colors = dashboard_context.colors(self.env, 'secondary')
+        hours_by_developer = self._get_dashboard_hours_by_user(buckets, interval, dashboard_context)
 
         data = {
-            'labels': weeks,
+            'labels': [label for label, _start, _end in buckets],
+            'interval': interval,
             'datasets': [
                 {
-                    'label': dev.name,
-                    'data': [
-                        sum(self.search([
-                            ('user_ids', 'in', [dev.id]),
-                            ('task_start_date', '>=', start_date + timedelta(weeks=i)),
-                            ('task_start_date', '<', start_date + timedelta(weeks=i + 1))
-                        ]).mapped('actual_hours'))
-                        for i in range(total_weeks)
-                    ],
+                    'label': dev['name'],
+                    'data': hours_by_developer[dev['id']],
                     'borderColor': colors[i % len(colors)],
                     'backgroundColor': secondary_colors[i % len(secondary_colors)],
                     'tension': 0.1
@@ -505,65 +702,139 @@ class ProjectTask(models.Model):
                 for i, dev in enumerate(developers)
             ]
         }
+        if max_points:
+            series = [dataset['data'] for dataset in data['datasets']]
+            data['labels'], series = downsample_series(data['labels'], series, max_points)
+            for dataset, values in zip(data['datasets'], series):
+                dataset['data'] = values
         return data
-    def _get_capacity_allocation_data(self, start_date, end_date, interval):
+
+    def _get_capacity_allocation_data(self, start_date, end_date, interval, max_points=None,
+                                      dashboard_context=None):
         """
         Get capacity allocation data for developers within the specified date range
 
         Args:
             start_date: datetime - Start date for data collection
             end_date: datetime - End date for data collection
-            interval: str - Time interval ('day', 'week', or 'month')
+            interval: str - Time interval ('day', 'week', 'month' or 'auto')
+            max_points: int - Maximum number of intervals returned, a coarser
+                interval is used above it, then the intervals are decimated
+            dashboard_context: DashboardContext - Records shared by the widgets of the request
 
         Returns:
             dict: Formatted data for capacity allocation chart
         """
-        developers = self.env['res.users'].search([('share', '=', False)])
-
-        # Determine the number of intervals based on the selected period
-        if interval == 'day':
-            intervals = [(end_date - timedelta(days=i)).strftime('%Y-%m-%d')
-                         for i in range((end_date - start_date).days + 1)]
-        elif interval == 'week':
-            intervals = [(end_date - timedelta(weeks=i)).strftime('%Y-%W')
-                         for i in range(4)]
-        else:  # month
-            intervals = [(end_date - timedelta(days=30 * i)).strftime('%Y-%m')
-                         for i in range(12)]
+        dashboard_context = dashboard_context or DashboardContext()
+        developers = dashboard_context.users(self.env)
+        interval, buckets = self._get_dashboard_buckets(start_date, end_date, interval, max_points)
+        hours_by_developer = self._get_dashboard_hours_by_user(
+            buckets, interval, dashboard_context, [('active', '=', True)])
+
+        # Most recent interval first
+        labels = [label for label, _start, _end in reversed(buckets)]
+        rows = [[round(hours, 2) for hours in reversed(hours_by_developer[dev['id']])] for dev in developers]
+        if max_points:
+            labels, rows = downsample_series(labels, rows, max_points)
 
-        data = {
-            'developers': [dev.name for dev in developers],
-            'weeks': intervals,
-            'data': []
+        return {
+            'developers': [dev['name'] for dev in developers],
+            'weeks': labels,
+            'interval': interval,
+            'data': rows,
         }
 
-        for dev in developers:
-            dev_data = []
-            for i, interval_date in enumerate(intervals):
-                if interval == 'day':
-                    interval_start = datetime.strptime(interval_date, '%Y-%m-%d')
-                    interval_end = interval_start + timedelta(days=1)
-                elif interval == 'week':
-                    year, week = interval_date.split('-')
-                    interval_start = datetime.strptime(f'{year}-W{week}-1', '%Y-W%W-%w')
-                    interval_end = interval_start + timedelta(weeks=1)
-                else:  # month
-                    interval_start = datetime.strptime(interval_date, '%Y-%m')
-                    interval_end = (interval_start + timedelta(days=32)).replace(day=1)
-
-                tasks = self.search([
-                    ('user_ids', 'in', [dev.id]),
-                    ('task_start_date', '>=', interval_start),
-                    ('task_start_date', '<', interval_end),
-                    ('active', '=', True)
-                ])
-
-                hours = sum(tasks.mapped('actual_hours') or [0])
-                dev_data.append(round(hours, 2))
-
-            data['data'].append(dev_data)
+    def _get_dashboard_hours_by_user(self, buckets, interval, dashboard_context, domain=()):
+        """
+        Return the actual hours of the tasks started within ``buckets`` per
+        internal user assigned and bucket, as {user_id: [hours per bucket]}.
+        The rolled up months are read from the monthly rollups, the rest from a
+        single grouped query over the tasks matching ``domain``.
+        """
+        bucket_starts = [bucket_start for _label, bucket_start, _end in buckets]
+        hours_by_user = defaultdict(lambda: [0.0] * len(buckets))
+        domain = [
+            ('user_ids', 'in', dashboard_context.user_ids(self.env)),
+            ('project_id', '!=', False),
+            ('task_start_date', '>=', buckets[0][1]),
+            ('task_start_date', '<', buckets[-1][2]),
+        ] + list(domain)
+        span = self._get_dashboard_rollup_span(buckets, interval)
+        if span:
+            domain += self._exclude_rollup_span('task_start_date', span)
+            for row in self.env['project_dashboard.monthly_rollup']._read_span(span, ['task_hours']):
+                if row['user_id']:
+                    index = bisect.bisect_right(bucket_starts, row['month']) - 1
+                    hours_by_user[row['user_id']][index] += row['task_hours']
+        for user_id, bucket_start, hours in self._dashboard_aggregate(
+                domain, f'rel.user_id, date_trunc(\'{interval}\', "project_task".task_start_date), '
+                        'SUM("project_task".actual_hours)', '1, 2', join=TASK_ASSIGNEES_JOIN):
+            hours_by_user[user_id][bisect.bisect_right(bucket_starts, bucket_start) - 1] += hours or 0.0
+        return hours_by_user
+
+    def _resolve_dashboard_interval(self, start_date, end_date, interval='auto'):
+        """
+        Return the interval of the time series of the dashboard. The ``auto``
+        interval (and any unknown one) is picked from the length of the range:
+        days up to a month, weeks up to six months, months beyond.
+        """
+        if interval in DASHBOARD_INTERVALS:
+            return interval
+        days = (end_date - start_date).days
+        if days <= 31:
+            return 'day'
+        if days <= 186:
+            return 'week'
+        return 'month'
+
+    def _get_dashboard_buckets(self, start_date, end_date, interval, max_points=None):
+        """
+        Return the interval actually used and its (label, start, end) buckets
+        covering ``start_date`` to ``end_date``, oldest first. ``auto`` picks the
+        interval from the length of the range, and when there are more than
+        ``max_points`` buckets, the next coarser interval is tried. A reversed
+        range is swapped, so that there is always at least one bucket.
+        """
+        if start_date > end_date:
+            start_date, end_date = end_date, start_date
+        interval = self._resolve_dashboard_interval(start_date, end_date, interval)
+        intervals = DASHBOARD_INTERVALS[DASHBOARD_INTERVALS.index(interval):]
+        for interval in intervals:
+            day = datetime(start_date.year, start_date.month, start_date.day)
+            if interval == 'week':
+                current = day - timedelta(days=day.weekday())
+            elif interval == 'month':
+                current = day.replace(day=1)
+            else:
+                current = day
+
+            buckets = []
+            while current <= end_date:
+                if interval == 'week':
+                    bucket_end, label = current + timedelta(weeks=1), current.strftime('%Y-%W')
+                elif interval == 'month':
+                    bucket_end, label = (current + timedelta(days=32)).replace(day=1), current.strftime('%Y-%m')
+                else:
+                    bucket_end, label = current + timedelta(days=1), current.strftime('%Y-%m-%d')
+                buckets.append((label, current, bucket_end))
+                current = bucket_end
+            if not max_points or len(buckets) <= max_points:
+                break
+        return interval, buckets
+
+    def _get_dashboard_rollup_span(self, buckets, interval):
+        """
+        Return the span of the monthly ``buckets`` read from the monthly
+        rollups, or None. Finer intervals are always computed from the records.
+        """
+        if interval != 'month':
+            return None
+        return self.env['project_dashboard.monthly_rollup']._get_span(buckets[0][1], buckets[-1][2] - timedelta(days=1))
+
+    def _exclude_rollup_span(self, field, span):
+        """Domain of the records whose ``field`` falls outside the rolled up ``span``."""
+        return ['|', (field, '<', span[0]), (field, '>=', span[1])]
 
-        return data
     # def _get_developer_performance_breakdown(self, start_date, end_date):
     #     developers = self.env['res.users'].search([('share', '=', False)])
     #     data = []
@@ -585,83 +856,25 @@ class ProjectTask(models.Model):
     #             'categories': list(categories.values())
     #         })
     #     return data
-    def _get_task_distribution(self, start_date=False, end_date=False, _logger=None):
-        """
-        Get task type distribution breakdown for each developer
-        """
-        if not start_date:
-            start_date = fields.Date.today() - timedelta(days=30)
-        if not end_date:
-            end_date = fields.Date.today()
-
-        # Ensure we have datetime objects
-        if isinstance(start_date, str):
-            start_date = fields.Date.from_string(start_date)
-        if isinstance(end_date, str):
-            end_date = fields.Date.from_string(end_date)
-
-        developers = self.env['res.users'].search([
-            ('share', '=', False),
-            ('active', '=', True)
-        ])
-
-        colors = self._get_chart_colors()
-        data = []
-
-        # Get all unique task types first
-        all_task_types = self.env['project.task'].search([
-            ('create_date', '>=', start_date),
-            ('create_date', '<=', end_date)
-        ]).mapped('task_type')
-        all_task_types = list(set(all_task_types))  # Remove duplicates
-
-        for dev in developers:
-            try:
-                tasks = self.env['project.task'].search([
-                    ('user_ids', 'in', [dev.id]),
-                    ('create_date', '>=', start_date),
-                    ('create_date', '<=', end_date)
-                ])
-
-                if not tasks:
-                    continue
-
-                categories = []
-                for index, task_type in enumerate(all_task_types):
-                    type_tasks = tasks.filtered(lambda t: t.task_type == task_type)
-                    hours = sum(type_tasks.mapped('actual_hours') or [0.0])
-
-                    if hours > 0:  # Only add categories with hours
-                        categories.append({
-                            'type': task_type or 'Undefined',
-                            'hours': float(hours),
-                            'color': colors[index % len(colors)]
-                        })
-
-                if categories:  # Only add developer if they have task hours
-                    data.append({
-                        'developer': dev.name,
-                        'categories': categories
-                    })
-            except Exception as e:
-                _logger.error(f"Error processing developer {dev.name}: {str(e)}")
-                continue
-
-        return data
-
-    def _get_task_backlog_data(self):
-        tasks = self.search([])
-        colors = self._get_chart_colors()
-        secondary_colors = self._get_chart_colors('secondary')
+    def _get_task_backlog_data(self, dashboard_context=None):
+        dashboard_context = dashboard_context or DashboardContext()
+        stages = dashboard_context.stages(self.env)
+        colors = dashboard_context.colors(self.env)
+        secondary_colors = dashboard_context.colors(self.env, 'secondary')
+        # Task count per stage
+        task_stages = [
+            (stages.get(stage_id), count)
+            for stage_id, count in self._dashboard_aggregate([], '"project_task".stage_id, COUNT(*)', '1')
+        ]
 
         data = {
             'labels': ['To Do', 'In Progress', 'Done'],
             'datasets': [{
                 'label': 'Task Backlog',
                 'data': [
-                    len(tasks.filtered(lambda t: not t.stage_id.fold)),
-                    len(tasks.filtered(lambda t: not t.stage_id.fold and t.stage_id.sequence > 0)),
-                    len(tasks.filtered(lambda t: t.stage_id.fold))
+                    sum(count for stage, count in task_stages if not (stage and stage['fold'])),
+                    sum(count for stage, count in task_stages if stage and not stage['fold'] and stage['sequence'] > 0),
+                    sum(count for stage, count in task_stages if stage and stage['fold'])
                 ],
                 'backgroundColor': secondary_colors,
                 'borderColor': colors,
@@ -670,6 +883,41 @@ class ProjectTask(models.Model):
         }
         return data
 
+    def init(self):
+        super().init()
+        # Probed every minute by _cron_notify_dashboard_changes
+        for model in DASHBOARD_WIDGET_SOURCES:
+            table = self.env[model]._table
+            create_index(self.env.cr, f'{table}_write_date_index', table, ['write_date'])
+
+    @api.model
+    def _cron_notify_dashboard_changes(self):
+        """
+        Notify the open dashboards of the widgets affected by the projects, tasks
+        and timesheets modified since the previous run, in a single bus message.
+        Changes are thus coalesced over the interval of the cron.
+
+        The previous run is the ``lastcall`` the cron puts in the context (the
+        time it started): a manual run, or the first one, notifies nothing.
+        """
+        last_check = self.env.context.get('lastcall')
+        if not last_check:
+            return
+
+        widgets = set()
+        for model, model_widgets in DASHBOARD_WIDGET_SOURCES.items():
+            # Any modified record will do: no ordering, and the write_date index (see init)
+            query = f'SELECT 1 FROM "{self.env[model]._table}" WHERE write_date > %s'
+            if model == 'account.analytic.line':
+                query += ' AND project_id IS NOT NULL'
+            self.env.cr.execute(query + ' LIMIT 1', [last_check])
+            if self.env.cr.fetchone():
+                widgets.update(model_widgets)
+        if widgets:
+            self.env['bus.bus']._sendone('project_dashboard', 'project_dashboard/changed', {
+                'widgets': sorted(widgets),
+            })
+
 
 
 
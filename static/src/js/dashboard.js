@@ -5,22 +5,90 @@ odoo.define('project_dashboard.Dashboard', function (require) {
     var QWeb = core.qweb;
     var ajax = require('web.ajax');
     var rpc = require('web.rpc');
+    var session = require('web.session');
     var _t = core._t;
     var AbstractAction = require('web.AbstractAction');
 
+    // Delay (ms) before reloading after a date change, so that editing both
+    // bounds of the range only triggers one request.
+    var DATE_CHANGE_DELAY = 400;
+    // Animate the charts when their data is refreshed, not only when they are created
+    var ANIMATE_UPDATES = false;
+    // Widgets shown by the template itself, loaded with the action. The charts
+    // only request their widget once their canvas scrolls into view.
+    var TEMPLATE_WIDGETS = ['summary', 'recent_projects'];
+    // Dashboard data kept in the browser storage, per user and date range, and
+    // shown while it is being reloaded
+    var CACHE_PREFIX = 'project_dashboard.data.v2.';
+    var CACHE_SIZE = 10;
+    // Points per time series chart (capacity allocation, burn rate), the server
+    // picks a coarser interval or decimates the series above it
+    var MAX_CHART_POINTS = 120;
+    var DATA_ROUTE = '/project/dashboard/data';
+    // Ranges longer than this (in days) are computed by a background job: its
+    // user is notified on the bus when the result is ready, and the state of
+    // the job is also polled in case the notification is missed
+    var ASYNC_RANGE_DAYS = 366;
+    var JOB_POLL_INTERVAL = 5000;
+    var JOB_SUBMIT_ROUTE = '/project/dashboard/job/submit';
+    var JOB_STATE_ROUTE = '/project/dashboard/job/state';
+    var JOB_RESULT_ROUTE = '/project/dashboard/job/result';
+    // Fetches, decodes and shapes the dashboard data off the main thread
+    var WORKER_URL = '/project_dashboard/static/src/js/dashboard_worker.js';
+    // Chart.js is only loaded with the dashboard, not with the backend assets
+    var CHART_JS_URL = '/project_dashboard/static/lib/chartjs/chart.min.js';
+    // Chart.js 3, kept out of the global scope: the graph views of Odoo use their own Chart.js 2
+    var ChartJS = null;
+    // Render method of the widget of each chart, in rendering order
+    var CHART_RENDERERS = {
+        weekly_developer_utilization: '_renderWeeklyUtilization',
+        task_distribution: '_renderTaskDistribution',
+        bug_resolution: '_renderBugResolution',
+        capacity_allocation: '_renderCapacityAllocation',
+        task_completion: '_renderTaskCompletion',
+        project_progress: '_renderProjectProgress',
+        timesheet_compliance: '_renderTimesheetCompliance',
+        task_overruns: '_renderTaskOverruns',
+        weekly_burn_rate: '_renderWeeklyBurnRate',
+        task_backlog: '_renderTaskBacklog'
+    };
+
     var ProjectDashboard = AbstractAction.extend({
         template: 'ProjectDashboard',
         events: {
             'click .refresh-dashboard': '_onRefreshDashboard',
             'click .total-projects-card': '_onTotalProjectsClick',
+            'click .o_dashboard_export': '_onExportClick',
             'change #start_date': '_onDateChange',
-            'change #end_date': '_onDateChange'
+            'change #end_date': '_onDateChange',
+            'change #interval': '_onIntervalChange'
         },
 
         init: function(parent, context) {
             this._super(parent, context);
             this.dashboardData = {};
             this.charts = {};
+            // Incremented on every load of a range, responses for a superseded
+            // range are dropped
+            this._loadSequence = 0;
+            this._pendingLoad = null;
+            this._pendingRequests = new Set();
+            this._requestId = 0;
+            this._onDateChange = _.debounce(this._onDateChange.bind(this), DATE_CHANGE_DELAY);
+
+            // Lazy loading of the charts: widgets requested for the current
+            // range, charts in view, and widgets waiting to be requested
+            this._lazy = 'IntersectionObserver' in window;
+            this._loadedWidgets = new Set();
+            this._visibleWidgets = new Set();
+            this._queuedWidgets = new Set();
+            this._loadQueuedWidgets = _.debounce(this._loadQueuedWidgets.bind(this), 100);
+            this._onBusNotification = this._onBusNotification.bind(this);
+            this._worker = null;
+            this._workerRequests = new Map();
+            this._workerRequestId = 0;
+            // Background jobs waited for, by id
+            this._jobs = new Map();
 
             // Set default dates
             var today = new Date();
@@ -29,21 +97,59 @@ odoo.define('project_dashboard.Dashboard', function (require) {
 
             this.startDate = this._formatDate(thirtyDaysAgo);
             this.endDate = this._formatDate(today);
+            // Picked by the server from the length of the range
+            this.interval = 'auto';
         },
 
         willStart: function() {
+            // Render the cached data of the range right away, it is
+            // revalidated once the action is started
+            var cached = this._readCache();
+            if (cached) {
+                this.dashboardData = cached.data;
+                this._asOf = cached.asOf;
+                this._revalidate = true;
+                return $.when(this._super.apply(this, arguments), this._loadChartLibrary());
+            }
             return $.when(
                 this._super.apply(this, arguments),
-                this._loadDashboardData()
+                this._loadChartLibrary(),
+                this._loadDashboardData(this._lazy ? TEMPLATE_WIDGETS : undefined)
             );
         },
 
+        _loadChartLibrary: function() {
+            if (ChartJS) {
+                return Promise.resolve();
+            }
+            var previous = window.Chart;
+            return ajax.loadJS(CHART_JS_URL).then(() => {
+                var loaded = window.Chart;
+                window.Chart = previous;
+                if (!loaded || !String(loaded.version).startsWith('3.')) {
+                    throw new Error(_.str.sprintf(_t("Chart.js 3 could not be loaded from %s"), CHART_JS_URL));
+                }
+                ChartJS = loaded;
+            });
+        },
+
         start: function() {
             return this._super().then(() => {
                 // Set initial date values
                 this.$('#start_date').val(this.startDate);
                 this.$('#end_date').val(this.endDate);
-                this._renderCharts();
+                this._renderAsOf();
+                // Pushed by the server when dashboard data changes
+                this.call('bus_service', 'addChannel', 'project_dashboard');
+                this.call('bus_service', 'addEventListener', 'notification', this._onBusNotification);
+                if (this._revalidate) {
+                    this._revalidateDashboard();
+                }
+                if (this._lazy) {
+                    this._observeCharts();
+                } else {
+                    this._renderCharts();
+                }
             });
         },
 
@@ -53,30 +159,427 @@ odoo.define('project_dashboard.Dashboard', function (require) {
 
         _onDateChange: function(ev) {
             // Update start or end date
-            var startInput = this.$('#start_date');
-            var endInput = this.$('#end_date');
+            var startDate = this.$('#start_date').val();
+            var endDate = this.$('#end_date').val();
+
+            // Wait for a complete and valid range, and skip unchanged ones
+            if (!startDate || !endDate || startDate > endDate) {
+                return;
+            }
+            if (startDate === this.startDate && endDate === this.endDate) {
+                return;
+            }
+            this.startDate = startDate;
+            this.endDate = endDate;
+
+            this._reloadDashboard();
+        },
+
+        _onIntervalChange: function(ev) {
+            this.interval = ev.currentTarget.value;
+            this._reloadDashboard();
+        },
+
+        _reloadDashboard: function() {
+            // Charts out of view are reloaded when they scroll back into view
+            var charts = this._lazy ? Array.from(this._visibleWidgets) : undefined;
+            var widgets = charts && TEMPLATE_WIDGETS.concat(charts);
+
+            // Show the cached data of the range while it is reloaded
+            var cached = this._readCache();
+            if (cached) {
+                this.dashboardData = cached.data;
+                this._asOf = cached.asOf;
+                this._renderTemplateWidgets();
+                this._renderCharts(charts);
+            }
+            return this._loadDashboardData(widgets, !!cached).then(loaded => {
+                if (loaded) {
+                    this._renderTemplateWidgets();
+                    this._renderCharts(charts);
+                }
+            });
+        },
+
+        /**
+         * Reload the template widgets (or everything when the charts are not
+         * lazy loaded) over the cached data rendered by willStart. The charts
+         * in view are reloaded by the chart observer.
+         */
+        _revalidateDashboard: function() {
+            var widgets = this._lazy ? TEMPLATE_WIDGETS : undefined;
+            return this._loadDashboardData(widgets, true).then(loaded => {
+                if (loaded) {
+                    this._renderTemplateWidgets();
+                    if (!this._lazy) {
+                        this._renderCharts();
+                    }
+                }
+            });
+        },
+
+        /**
+         * Load the dashboard data of the current range, for the given widgets or
+         * for all of them. A load supersedes the pending ones: the request of the
+         * previous one is aborted when possible, and all their responses are
+         * ignored. With ``keepData``, the response is merged into the current
+         * data instead of replacing it. Resolves to false when superseded.
+         */
+        _loadDashboardData: function(widgets, keepData) {
+            var sequence = ++this._loadSequence;
+            if (this._pendingLoad && this._pendingLoad.abort) {
+                this._pendingLoad.abort(false);
+            }
+            this._pendingRequests.clear();
+            this._queuedWidgets.clear();
+            this._cacheDirty = false;
+            this._loadedWidgets = new Set(widgets);
+            return this._requestDashboardData(widgets, sequence, true, !keepData);
+        },
+
+        _requestDashboardData: function(widgets, sequence, rangeLoad, replace) {
+            var requestId = ++this._requestId;
+            this._pendingRequests.add(requestId);
+            this._setLoading(true);
+
+            var load = this._fetchDashboardData({
+                start_date: this.startDate,
+                end_date: this.endDate,
+                widgets: widgets,
+                max_points: MAX_CHART_POINTS,
+                interval: this.interval
+            });
+            if (rangeLoad) {
+                this._pendingLoad = load;
+            }
+            return load.then(data => {
+                if (sequence !== this._loadSequence) {
+                    return false;
+                }
+                // The widgets of this response replace their previous degraded state
+                var degraded = replace ? {} : Object.assign({}, this.dashboardData.degraded_widgets);
+                Object.keys(data).forEach(key => delete degraded[key]);
+                Object.assign(degraded, data.degraded_widgets);
+                this.dashboardData = replace ? data : Object.assign(this.dashboardData, data);
+                this.dashboardData.degraded_widgets = degraded;
+                if (rangeLoad) {
+                    this._asOf = Date.now();
+                    this._renderAsOf();
+                }
+                this._cacheDirty = true;
+                return true;
+            }, () => false).finally(() => {
+                this._pendingRequests.delete(requestId);
+                if (load === this._pendingLoad) {
+                    this._pendingLoad = null;
+                }
+                this._setLoading(this._pendingRequests.size > 0);
+                // Cache the range once it is loaded, not after each of its responses
+                if (!this._pendingRequests.size && this._cacheDirty) {
+                    this._cacheDirty = false;
+                    this._writeCache();
+                }
+            });
+        },
+
+        /**
+         * Fetch the dashboard data of the range, from a background job when
+         * the range is too large to be computed within the request. The
+         * returned promise can be aborted like an RPC.
+         */
+        _fetchDashboardData: function(params) {
+            var days = (new Date(params.end_date) - new Date(params.start_date)) / 86400000;
+            if (days > ASYNC_RANGE_DAYS) {
+                return this._runDashboardJob(params);
+            }
+            return this._fetchInWorker(DATA_ROUTE, params);
+        },
 
-            this.startDate = startInput.val();
-            this.endDate = endInput.val();
+        /**
+         * Fetch the dashboard data from ``route`` in the worker, which decodes
+         * the response and shapes the heavy widgets into typed arrays. Without
+         * worker support, the data is fetched and shaped on the main thread.
+         */
+        _fetchInWorker: function(route, params) {
+            if (!window.Worker) {
+                return Promise.all([
+                    this._rpc({route: route, params: params}),
+                    ajax.loadJS(WORKER_URL)
+                ]).then(([data]) => window.projectDashboardShapeData(data));
+            }
+            if (!this._worker) {
+                this._worker = new Worker(WORKER_URL);
+                this._worker.onmessage = this._onWorkerMessage.bind(this);
+            }
+            var id = ++this._workerRequestId;
+            var request = new Promise((resolve, reject) => {
+                this._workerRequests.set(id, {resolve: resolve, reject: reject});
+            });
+            this._worker.postMessage({id: id, type: 'load', url: route, params: params});
+            request.abort = rejectError => {
+                var pending = this._workerRequests.get(id);
+                this._workerRequests.delete(id);
+                if (this._worker) {
+                    this._worker.postMessage({id: id, type: 'abort'});
+                }
+                if (pending && rejectError !== false) {
+                    pending.reject(new Error('aborted'));
+                }
+            };
+            return request;
+        },
 
-            // Reload dashboard data
-            this._loadDashboardData().then(() => {
-                this._renderCharts();
+        /**
+         * Submit a background job computing the dashboard data, and fetch its
+         * result once it is done. Aborting the returned promise stops waiting
+         * for the job, which still runs to completion on the server.
+         */
+        _runDashboardJob: function(params) {
+            var job = {id: null, timer: null, fetch: null, aborted: false};
+            var request = new Promise((resolve, reject) => {
+                job.resolve = resolve;
+                job.reject = reject;
             });
+            this._rpc({route: JOB_SUBMIT_ROUTE, params: params}).then(result => {
+                if (job.aborted) {
+                    return;
+                }
+                job.id = result.job_id;
+                this._jobs.set(job.id, job);
+                job.timer = setInterval(() => this._checkDashboardJob(job), JOB_POLL_INTERVAL);
+            }, job.reject);
+            request.abort = rejectError => {
+                job.aborted = true;
+                this._forgetDashboardJob(job);
+                if (job.fetch) {
+                    job.fetch.abort(rejectError);
+                } else if (rejectError !== false) {
+                    job.reject(new Error('aborted'));
+                }
+            };
+            return request;
         },
 
-        _loadDashboardData: function() {
-            return this._rpc({
-                route: '/project/dashboard/data',
-                params: {
-                    start_date: this.startDate,
-                    end_date: this.endDate
+        _checkDashboardJob: function(job) {
+            if (job.checking || job.fetch || job.aborted) {
+                return;
+            }
+            job.checking = true;
+            this._rpc({route: JOB_STATE_ROUTE, params: {job_id: job.id}}).then(result => {
+                job.checking = false;
+                if (job.aborted || job.fetch) {
+                    return;
                 }
-            }).then(data => {
-                this.dashboardData = data;
+                if (result.state === 'done') {
+                    this._forgetDashboardJob(job);
+                    job.fetch = this._fetchInWorker(JOB_RESULT_ROUTE, {job_id: job.id});
+                    job.fetch.then(job.resolve, job.reject);
+                } else if (result.state === 'failed') {
+                    this._forgetDashboardJob(job);
+                    this.displayNotification({
+                        type: 'danger',
+                        title: _t("The dashboard data could not be loaded"),
+                        message: result.error
+                    });
+                    job.reject(new Error(result.error));
+                }
+            }, () => {
+                job.checking = false;  // Polled again at the next interval
             });
         },
 
+        _forgetDashboardJob: function(job) {
+            clearInterval(job.timer);
+            this._jobs.delete(job.id);
+        },
+
+        _onWorkerMessage: function(ev) {
+            var message = ev.data;
+            var request = this._workerRequests.get(message.id);
+            if (!request) {
+                return;  // Aborted
+            }
+            this._workerRequests.delete(message.id);
+            if (message.error) {
+                var error = message.error.data || message.error;
+                this.displayNotification({
+                    type: 'danger',
+                    title: _t("The dashboard data could not be loaded"),
+                    message: error.message
+                });
+                request.reject(message.error);
+            } else {
+                request.resolve(message.result);
+            }
+        },
+
+        _observeCharts: function() {
+            this._chartObserver = new IntersectionObserver(entries => {
+                entries.forEach(entry => {
+                    var widget = entry.target.dataset.widget;
+                    if (!entry.isIntersecting) {
+                        this._visibleWidgets.delete(widget);
+                        return;
+                    }
+                    this._visibleWidgets.add(widget);
+                    if (!this._loadedWidgets.has(widget)) {
+                        this._queuedWidgets.add(widget);
+                        // Cached data, shown until the fresh data is loaded
+                        if (this.dashboardData[widget]) {
+                            this._renderCharts([widget]);
+                        }
+                    }
+                });
+                if (this._queuedWidgets.size) {
+                    this._loadQueuedWidgets();
+                }
+            }, {rootMargin: '200px 0px'});
+            this.el.querySelectorAll('canvas[data-widget]').forEach(canvas => {
+                this._chartObserver.observe(canvas);
+            });
+        },
+
+        /**
+         * Request the widgets of the charts that came into view, in one request,
+         * and render them once loaded.
+         */
+        _loadQueuedWidgets: function() {
+            var widgets = Array.from(this._queuedWidgets);
+            if (!widgets.length) {
+                return Promise.resolve();
+            }
+            this._queuedWidgets.clear();
+            widgets.forEach(widget => this._loadedWidgets.add(widget));
+            return this._requestDashboardData(widgets, this._loadSequence, false, false).then(loaded => {
+                if (loaded) {
+                    this._renderCharts(widgets);
+                }
+            });
+        },
+
+        _cacheKey: function() {
+            return CACHE_PREFIX + session.uid + '.' + this.startDate + '.' + this.endDate + '.' + this.interval;
+        },
+
+        _readCache: function() {
+            try {
+                return JSON.parse(window.localStorage.getItem(this._cacheKey()));
+            } catch (error) {
+                return null;  // Storage unavailable or corrupted entry
+            }
+        },
+
+        /**
+         * Store the data of the current range, and drop the oldest ranges of the
+         * user beyond CACHE_SIZE. The ranges of the user and their asOf are
+         * listed in a small index entry, so that the cached data is never read
+         * back to evict it.
+         */
+        _writeCache: function() {
+            var prefix = CACHE_PREFIX + session.uid + '.';
+            var indexKey = prefix + 'index';
+            try {
+                var cacheKey = this._cacheKey();
+                window.localStorage.setItem(cacheKey, JSON.stringify({
+                    asOf: this._asOf,
+                    data: this.dashboardData
+                }, (key, value) => ArrayBuffer.isView(value) ? Array.from(value) : value));
+
+                var index = JSON.parse(window.localStorage.getItem(indexKey));
+                if (!index) {
+                    // Ranges cached before the index: evicted first
+                    index = {};
+                    for (var position = 0; position < window.localStorage.length; position++) {
+                        var key = window.localStorage.key(position);
+                        if (key.startsWith(prefix) && key !== indexKey) {
+                            index[key] = 0;
+                        }
+                    }
+                }
+                index[cacheKey] = this._asOf || 0;
+                Object.keys(index).sort((a, b) => index[b] - index[a]).slice(CACHE_SIZE).forEach(key => {
+                    window.localStorage.removeItem(key);
+                    delete index[key];
+                });
+                window.localStorage.setItem(indexKey, JSON.stringify(index));
+            } catch (error) {
+                // Storage unavailable or full: the dashboard works without cache
+            }
+        },
+
+        _renderAsOf: function() {
+            var label = this._asOf ? _.str.sprintf(_t("As of %s"), new Date(this._asOf).toLocaleString()) : '';
+            this.$('.o_dashboard_as_of').text(label);
+        },
+
+        /**
+         * Update the parts of the template showing the summary and the recent
+         * projects, which are only rendered with the action otherwise.
+         */
+        _renderTemplateWidgets: function() {
+            var summary = this.dashboardData.summary || {};
+            this.$('[data-summary]').each((index, element) => {
+                element.textContent = summary[element.dataset.summary] || 0;
+            });
+            this.$('.o_recent_projects').html(QWeb.render('ProjectDashboard.RecentProjects', {widget: this}));
+            this._renderDegraded();
+        },
+
+        /**
+         * Flag the cards of the widgets served degraded data because they ran
+         * over their budget: the last computed data, monthly totals, or none.
+         */
+        _renderDegraded: function() {
+            if (!this.el) {
+                return;
+            }
+            var degraded = this.dashboardData.degraded_widgets || {};
+            this.el.querySelectorAll('[data-degraded-widget]').forEach(marker => {
+                var info = degraded[marker.dataset.degradedWidget];
+                marker.classList.toggle('d-none', !info);
+                if (!info) {
+                    return;
+                }
+                if (info.fallback === 'cache') {
+                    marker.textContent = _t("Cached");
+                    marker.title = _.str.sprintf(_t("Timed out, showing the data computed on %s"), info.as_of);
+                } else if (info.fallback === 'coarse') {
+                    marker.textContent = _t("Partial");
+                    marker.title = _t("Timed out, showing monthly totals");
+                } else {
+                    marker.textContent = _t("Timed out");
+                    marker.title = _t("This widget could not be computed in time");
+                }
+            });
+        },
+
+        _setLoading: function(loading) {
+            if (!this.$el) {
+                return;  // Not rendered yet (initial load)
+            }
+            this.$el.toggleClass('o_dashboard_loading', loading);
+            this.$('.o_dashboard_loading_indicator').toggleClass('d-none', !loading);
+        },
+
+        destroy: function() {
+            this._onDateChange.cancel();
+            this._loadQueuedWidgets.cancel();
+            this.call('bus_service', 'removeEventListener', 'notification', this._onBusNotification);
+            this.call('bus_service', 'deleteChannel', 'project_dashboard');
+            if (this._chartObserver) {
+                this._chartObserver.disconnect();
+            }
+            if (this._worker) {
+                this._worker.terminate();
+                this._worker = null;
+            }
+            this._jobs.forEach(job => this._forgetDashboardJob(job));
+            this._loadSequence++;
+            Object.values(this.charts).forEach(chart => chart.destroy());
+            this.charts = {};
+            this._super.apply(this, arguments);
+        },
+
 
          _onTotalProjectsClick: function(ev) {
             ev.preventDefault();
@@ -92,17 +595,16 @@ odoo.define('project_dashboard.Dashboard', function (require) {
             });
         },
 
-        _renderCharts: function() {
-            this._renderWeeklyUtilization();
-            this._renderTaskDistribution();
-            this._renderBugResolution();
-            this._renderCapacityAllocation();
-            this._renderTaskCompletion();
-            this._renderProjectProgress();
-            this._renderTimesheetCompliance();
-            this._renderTaskOverruns();
-            this._renderWeeklyBurnRate();
-            this._renderTaskBacklog();
+        /**
+         * Render the charts of the given widgets, or all of them.
+         */
+        _renderCharts: function(widgets) {
+            (widgets || Object.keys(CHART_RENDERERS)).forEach(widget => {
+                if (CHART_RENDERERS[widget]) {
+                    this[CHART_RENDERERS[widget]]();
+                }
+            });
+            this._renderDegraded();
         },
 
 
@@ -110,11 +612,7 @@ odoo.define('project_dashboard.Dashboard', function (require) {
             const ctx = this.el.querySelector('#weeklyUtilizationChart');
 
             if (ctx && this.dashboardData.weekly_developer_utilization) {
-                if (this.charts.weeklyUtilization) {
-                    this.charts.weeklyUtilization.destroy();
-                }
-
-                this.charts.weeklyUtilization = new Chart(ctx, {
+                this._upsertChart('weeklyUtilization', ctx, {
                     type: 'bar',
                     data: this.dashboardData.weekly_developer_utilization,
                     options: {
@@ -180,49 +678,23 @@ odoo.define('project_dashboard.Dashboard', function (require) {
                 return;  // Exit if no context or data
             }
 
-            // Destroy existing chart if it exists
-            if (this.charts.taskDistribution) {
-                this.charts.taskDistribution.destroy();
-            }
-
+            // Total hours per task type, shaped by the worker. No task type
+            // still updates the chart, so that it does not keep showing the
+            // previous range
             const data = this.dashboardData.task_distribution;
-            if (!data.length) {
-                return;  // Exit if no data
-            }
-
-            // Collect all unique categories across all developers
-            const allCategories = new Set();
-            data.forEach(dev => {
-                dev.categories.forEach(cat => {
-                    allCategories.add(cat.type);
-                });
-            });
-            const categories = Array.from(allCategories);
-
-            // Calculate total hours for each category
-            const categoryHours = {};
-            categories.forEach(cat => {
-                categoryHours[cat] = 0;
-                data.forEach(dev => {
-                    const category = dev.categories.find(c => c.type === cat);
-                    if (category) {
-                        categoryHours[cat] += category.hours;
-                    }
-                });
-            });
 
             // Prepare chart data
             const chartData = {
-                labels: categories,
+                labels: data.labels,
                 datasets: [{
-                    data: categories.map(cat => categoryHours[cat]),
-                    backgroundColor: categories.map((_, index) => this._getChartColor(index)),
+                    data: Array.from(data.hours),
+                    backgroundColor: data.labels.map((_, index) => this._getChartColor(index)),
                     borderWidth: 1
                 }]
             };
 
-            // Create new chart
-            this.charts.taskDistribution = new Chart(ctx, {
+            // Create or update the chart
+            this._upsertChart('taskDistribution', ctx, {
                 type: 'pie',
                 data: chartData,
                 options: {
@@ -261,10 +733,7 @@ odoo.define('project_dashboard.Dashboard', function (require) {
         _renderBugResolution: function() {
             const ctx = this.el.querySelector('#bugResolutionChart');
             if (ctx && this.dashboardData.bug_resolution) {
-                if (this.charts.bugResolution) {
-                    this.charts.bugResolution.destroy();
-                }
-                this.charts.bugResolution = new Chart(ctx, {
+                this._upsertChart('bugResolution', ctx, {
                     type: 'line',
                     data: this.dashboardData.bug_resolution,
                     options: {
@@ -287,13 +756,9 @@ odoo.define('project_dashboard.Dashboard', function (require) {
         _renderCapacityAllocation: function() {
             const ctx = this.el.querySelector('#capacityAllocationChart');
             if (ctx && this.dashboardData.capacity_allocation) {
-                if (this.charts.capacityAllocation) {
-                    this.charts.capacityAllocation.destroy();
-                }
-
                 const data = this.dashboardData.capacity_allocation;
 
-                this.charts.capacityAllocation = new Chart(ctx, {
+                this._upsertChart('capacityAllocation', ctx, {
 //                    type: 'heatmap',
                     type: 'bar',
 
@@ -321,11 +786,7 @@ odoo.define('project_dashboard.Dashboard', function (require) {
         _renderTaskCompletion: function() {
             const ctx = this.el.querySelector('#taskCompletionChart');
             if (ctx && this.dashboardData.task_completion) {
-                if (this.charts.taskCompletion) {
-                    this.charts.taskCompletion.destroy();
-                }
-
-                this.charts.taskCompletion = new Chart(ctx, {
+                this._upsertChart('taskCompletion', ctx, {
                     type: 'bar',
                     data: this.dashboardData.task_completion,
                     options: {
@@ -373,23 +834,20 @@ odoo.define('project_dashboard.Dashboard', function (require) {
             const ctx = this.el.querySelector('#projectProgressChart');
             if (!ctx || !this.dashboardData.project_progress) return;
 
-            if (this.charts.projectProgressChart) {
-                this.charts.projectProgressChart.destroy();
-            }
-
+            // Completed and remaining tasks as percentages of the tasks of
+            // each project (the width of the bars), computed by the worker
             const data = this.dashboardData.project_progress;
-
-            // Calculate the maximum total tasks for scaling
-            const maxTotal = Math.max(...data.total_tasks);
-
-            // Normalize the data to percentages of total width
             const normalizedData = {
                 labels: data.labels,
-                completed: data.completed.map((val, idx) => (val / data.total_tasks[idx]) * 100),
-                remaining: data.remaining.map((val, idx) => (val / data.total_tasks[idx]) * 100)
+                completed: Array.from(data.completed_ratio),
+                remaining: Array.from(data.remaining_ratio)
             };
 
-            this.charts.projectProgressChart = new Chart(ctx, {
+            // The chart outlives this call when it is updated in place: its
+            // callbacks must read the data it currently displays
+            const currentData = () => this.dashboardData.project_progress;
+
+            this._upsertChart('projectProgressChart', ctx, {
                 type: 'bar',
                 data: {
                     labels: normalizedData.labels,
@@ -445,6 +903,7 @@ odoo.define('project_dashboard.Dashboard', function (require) {
                         tooltip: {
                             callbacks: {
                                 label: function(context) {
+                                    const data = currentData();
                                     const dataIndex = context.dataIndex;
                                     const completed = data.completed[dataIndex];
                                     const total = data.total_tasks[dataIndex];
@@ -465,6 +924,7 @@ odoo.define('project_dashboard.Dashboard', function (require) {
                             const ctx = chart.ctx;
                             const yAxis = chart.scales.y;
                             const xAxis = chart.scales.x;
+                            const data = currentData();
 
                             chart.data.labels.forEach((label, index) => {
                                 const completed = data.completed[index];
@@ -498,10 +958,13 @@ odoo.define('project_dashboard.Dashboard', function (require) {
         _renderTaskOverruns: function() {
             const ctx = this.el.querySelector('#taskOverrunChart');
             if (ctx && this.dashboardData.task_overruns) {
-                if (this.charts.taskOverrun) {
-                    this.charts.taskOverrun.destroy();
-                }
-                this.charts.taskOverrun = new Chart(ctx, {
+                // The summary is part of the template, which may have been
+                // rendered before this widget was loaded
+                const summary = this.dashboardData.task_overruns.summary;
+                this.$('.o_overrun_total').text(summary.total_overrun_tasks);
+                this.$('.o_overrun_average').text(summary.avg_overrun_percentage);
+
+                this._upsertChart('taskOverrun', ctx, {
                     type: 'bar',
                     data: this.dashboardData.task_overruns.data,
                     options: {
@@ -542,10 +1005,7 @@ odoo.define('project_dashboard.Dashboard', function (require) {
         _renderTimesheetCompliance: function() {
             const ctx = this.el.querySelector('#timesheetComplianceChart');
             if (ctx && this.dashboardData.timesheet_compliance) {
-                if (this.charts.timesheetCompliance) {
-                    this.charts.timesheetCompliance.destroy();
-                }
-                this.charts.timesheetCompliance = new Chart(ctx, {
+                this._upsertChart('timesheetCompliance', ctx, {
                     type: 'doughnut',  // Change to 'doughnut' for the donut style
                     data: this.dashboardData.timesheet_compliance,
                     options: {
@@ -570,10 +1030,7 @@ odoo.define('project_dashboard.Dashboard', function (require) {
         _renderWeeklyBurnRate: function() {
             const ctx = this.el.querySelector('#weeklyBurnRateChart');
             if (ctx && this.dashboardData.weekly_burn_rate) {
-                if (this.charts.weeklyBurnRate) {
-                    this.charts.weeklyBurnRate.destroy();
-                }
-                this.charts.weeklyBurnRate = new Chart(ctx, {
+                this._upsertChart('weeklyBurnRate', ctx, {
                     type: 'line',
                     data: this.dashboardData.weekly_burn_rate,
                     options: {
@@ -593,10 +1050,7 @@ odoo.define('project_dashboard.Dashboard', function (require) {
         _renderTaskBacklog: function() {
             const ctx = this.el.querySelector('#taskBacklogChart');
             if (ctx && this.dashboardData.task_backlog) {
-                if (this.charts.taskBacklog) {
-                    this.charts.taskBacklog.destroy();
-                }
-                this.charts.taskBacklog = new Chart(ctx, {
+                this._upsertChart('taskBacklog', ctx, {
                     type: 'bar',
                     data: this.dashboardData.task_backlog,
                     options: {
@@ -614,6 +1068,34 @@ odoo.define('project_dashboard.Dashboard', function (require) {
         },
 
 
+        /**
+         * Create the chart ``key`` on the canvas ``ctx``, or update the existing
+         * one in place with the labels and datasets of ``config``. The options
+         * and callbacks of an existing chart are kept.
+         */
+        _upsertChart: function(key, ctx, config) {
+            const chart = this.charts[key];
+            if (chart && chart.canvas === ctx && chart.config.type === config.type) {
+                const datasets = config.data.datasets || [];
+                chart.data.labels = config.data.labels || [];
+                datasets.forEach((dataset, index) => {
+                    if (chart.data.datasets[index]) {
+                        Object.assign(chart.data.datasets[index], dataset);
+                    } else {
+                        chart.data.datasets.push(dataset);
+                    }
+                });
+                chart.data.datasets.length = datasets.length;
+                chart.update(ANIMATE_UPDATES ? undefined : 'none');
+                return chart;
+            }
+            if (chart) {
+                chart.destroy();
+            }
+            this.charts[key] = new ChartJS(ctx, config);
+            return this.charts[key];
+        },
+
         _getChartColor: function(index) {
             const colors = [
                 '#B3C100',  // Lime Green
@@ -627,10 +1109,63 @@ odoo.define('project_dashboard.Dashboard', function (require) {
             return colors[index % colors.length];
         },
 
-        _onRefreshDashboard: function() {
-            this._loadDashboardData().then(() => {
-                this._renderCharts();
+        /**
+         * Reload the widgets reported as changed by the server. In lazy mode,
+         * only those in view are reloaded now, the others when they scroll
+         * into view.
+         */
+        _onBusNotification: function({detail: notifications}) {
+            var changed = new Set();
+            notifications.forEach(notification => {
+                if (notification.type === 'project_dashboard/changed') {
+                    notification.payload.widgets.forEach(widget => changed.add(widget));
+                } else if (notification.type === 'project_dashboard/job_done') {
+                    var job = this._jobs.get(notification.payload.job_id);
+                    if (job) {
+                        this._checkDashboardJob(job);
+                    }
+                }
+            });
+            var widgets = Array.from(changed).filter(widget => {
+                if (!this._lazy || TEMPLATE_WIDGETS.includes(widget) || this._visibleWidgets.has(widget)) {
+                    return true;
+                }
+                this._loadedWidgets.delete(widget);
+                return false;
             });
+            if (!widgets.length) {
+                return;
+            }
+            widgets.forEach(widget => this._loadedWidgets.add(widget));
+            this._requestDashboardData(widgets, this._loadSequence, false, false).then(loaded => {
+                if (loaded) {
+                    if (widgets.some(widget => TEMPLATE_WIDGETS.includes(widget))) {
+                        this._renderTemplateWidgets();
+                    }
+                    this._renderCharts(widgets);
+                }
+            });
+        },
+
+        /**
+         * Download the export of a widget (data-export-widget) or of the rows
+         * underlying the dashboard (data-export-dataset) for the current range.
+         */
+        _onExportClick: function(ev) {
+            ev.preventDefault();
+            var data = ev.currentTarget.dataset;
+            var path = data.exportWidget ? 'widget/' + data.exportWidget : data.exportDataset;
+            var params = $.param({
+                start_date: this.startDate,
+                end_date: this.endDate,
+                interval: this.interval,
+                file_format: data.exportFormat || 'csv'
+            });
+            window.location.assign('/project/dashboard/export/' + path + '?' + params);
+        },
+
+        _onRefreshDashboard: function() {
+            this._reloadDashboard();
         }
     });
 
@@ -0,0 +1,120 @@
+/**
+ * Web Worker of the project dashboard: fetches and decodes the dashboard data,
+ * and shapes the heaviest widgets into ready-to-plot typed arrays, so that
+ * large responses do not block the main thread.
+ *
+ * Not part of an assets bundle: it is started from its URL by dashboard.js,
+ * which also loads it as a plain script to shape data without worker.
+ */
+(function (scope) {
+    "use strict";
+
+    /**
+     * Total hours per task type over all developers, in order of appearance.
+     */
+    function shapeTaskDistribution(developers) {
+        const hoursByType = new Map();
+        developers.forEach(developer => {
+            developer.categories.forEach(category => {
+                hoursByType.set(category.type, (hoursByType.get(category.type) || 0) + category.hours);
+            });
+        });
+        return {
+            labels: Array.from(hoursByType.keys()),
+            hours: Float64Array.from(hoursByType.values())
+        };
+    }
+
+    /**
+     * Task counts as typed arrays, and the completed and remaining tasks as
+     * percentages of the tasks of each project (the width of the bars).
+     */
+    function shapeProjectProgress(progress) {
+        const total = Float64Array.from(progress.total_tasks);
+        const completed = Float64Array.from(progress.completed);
+        const remaining = Float64Array.from(progress.remaining);
+        const completedRatio = new Float64Array(total.length);
+        const remainingRatio = new Float64Array(total.length);
+        for (let index = 0; index < total.length; index++) {
+            if (total[index]) {
+                completedRatio[index] = completed[index] / total[index] * 100;
+                remainingRatio[index] = remaining[index] / total[index] * 100;
+            }
+        }
+        return Object.assign({}, progress, {
+            completed: completed,
+            remaining: remaining,
+            total_tasks: total,
+            percentages: Float64Array.from(progress.percentages),
+            completed_ratio: completedRatio,
+            remaining_ratio: remainingRatio
+        });
+    }
+
+    /**
+     * Shape the widgets of a dashboard response in place. Already shaped
+     * widgets (e.g. from the browser cache) are left untouched.
+     */
+    function shapeDashboardData(data) {
+        if (Array.isArray(data.task_distribution)) {
+            data.task_distribution = shapeTaskDistribution(data.task_distribution);
+        }
+        if (data.project_progress && !data.project_progress.completed_ratio) {
+            data.project_progress = shapeProjectProgress(data.project_progress);
+        }
+        return data;
+    }
+
+    function typedArrayBuffers(data) {
+        const buffers = [];
+        [data.task_distribution, data.project_progress].forEach(widget => {
+            Object.values(widget || {}).forEach(value => {
+                if (ArrayBuffer.isView(value)) {
+                    buffers.push(value.buffer);
+                }
+            });
+        });
+        return buffers;
+    }
+
+    scope.projectDashboardShapeData = shapeDashboardData;
+
+    if (typeof WorkerGlobalScope === 'undefined' || !(scope instanceof WorkerGlobalScope)) {
+        return;
+    }
+
+    const controllers = new Map();
+
+    scope.onmessage = function (event) {
+        const message = event.data;
+        if (message.type === 'abort') {
+            if (controllers.has(message.id)) {
+                controllers.get(message.id).abort();
+            }
+            return;
+        }
+
+        const controller = new AbortController();
+        controllers.set(message.id, controller);
+        fetch(message.url, {
+            method: 'POST',
+            credentials: 'same-origin',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({jsonrpc: '2.0', method: 'call', id: message.id, params: message.params}),
+            signal: controller.signal
+        }).then(response => response.json()).then(response => {
+            if (response.error) {
+                scope.postMessage({id: message.id, error: response.error});
+                return;
+            }
+            const data = shapeDashboardData(response.result);
+            scope.postMessage({id: message.id, result: data}, typedArrayBuffers(data));
+        }).catch(error => {
+            if (error.name !== 'AbortError') {
+                scope.postMessage({id: message.id, error: {message: String(error)}});
+            }
+        }).finally(() => {
+            controllers.delete(message.id);
+        });
+    };
+})(self);
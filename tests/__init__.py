@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+
+from . import test_dashboard_benchmark
+from . import test_dashboard_query_counts
+from . import test_dashboard_downsampling
+from . import test_dashboard_rollups
+from . import test_dashboard_jobs
+from . import test_dashboard_budgets
+from . import test_dashboard_paging
+from . import test_dashboard_recent_projects
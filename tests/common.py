@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+import random
+from datetime import datetime, time, timedelta
+
+from odoo import Command, fields
+
+
+class DashboardDataMixin:
+    """Reproducible synthetic datasets for the dashboard aggregations."""
+
+    @classmethod
+    def _generate_dashboard_data(cls, env, users=5, projects=3, tasks=60, timesheets=300, bugs=10,
+                                 days=60, seed=42):
+        """
+        Create ``users`` internal users (each with an employee), ``projects``
+        projects, ``tasks`` tasks of which ``bugs`` are resolved bugs, and
+        ``timesheets`` timesheet lines, spread over the last ``days`` days.
+        The same arguments always produce the same dataset.
+        """
+        rng = random.Random(seed)
+        now = datetime.combine(fields.Date.today(), time(12))
+        prefix = f'dashboard_{seed}_{users}_{projects}_{tasks}'
+
+        group_ids = [env.ref('base.group_user').id, env.ref('hr_timesheet.group_hr_timesheet_user').id]
+        developers = env['res.users'].with_context(no_reset_password=True, mail_create_nolog=True).create([{
+            'name': f'Developer {i}',
+            'login': f'{prefix}_dev_{i}',
+            'groups_id': [Command.set(group_ids)],
+        } for i in range(users)])
+        employees = env['hr.employee'].create([{
+            'name': user.name,
+            'user_id': user.id,
+        } for user in developers])
+
+        stages = env['project.task.type'].create([
+            {'name': 'To Do', 'sequence': 0},
+            {'name': 'In Progress', 'sequence': 5},
+            {'name': 'Done', 'sequence': 10, 'fold': True},
+        ])
+        project_records = env['project.project'].with_context(mail_create_nolog=True).create([{
+            'name': f'Project {i}',
+            'user_id': rng.choice(developers).id,
+            'type_ids': [Command.set(stages.ids)],
+            'allow_timesheets': True,
+        } for i in range(projects)])
+
+        task_types = ['coding', 'bug_fix', 'testing', 'review', 'documentation']
+        task_vals = []
+        for i in range(tasks):
+            start = now - timedelta(days=rng.randrange(days), hours=rng.randrange(8))
+            vals = {
+                'name': f'Task {i}',
+                'project_id': rng.choice(project_records).id,
+                'stage_id': rng.choice(stages).id,
+                'user_ids': [Command.set(rng.sample(developers.ids, k=min(len(developers), rng.randint(1, 2))))],
+                'planned_hours': rng.choice([2, 4, 8, 16, 24]),
+                'task_type': rng.choice(task_types),
+                'task_start_date': start,
+                'task_end_date': start + timedelta(days=rng.randint(1, 10)),
+                'date_deadline': (start + timedelta(days=rng.randint(1, 10))).date(),
+            }
+            if i < bugs:
+                vals.update({
+                    'is_bug': True,
+                    'task_type': 'bug_fix',
+                    'bug_reported_date': start,
+                    'bug_resolution_date': min(start + timedelta(days=rng.randint(0, 14)), now),
+                })
+            task_vals.append(vals)
+        task_records = env['project.task'].with_context(mail_create_nolog=True, mail_notrack=True).create(task_vals)
+
+        employee_by_user = {employee.user_id.id: employee for employee in employees}
+        line_vals = []
+        for _i in range(timesheets):
+            task = rng.choice(task_records)
+            line_vals.append({
+                'name': '/',
+                'project_id': task.project_id.id,
+                'task_id': task.id,
+                'employee_id': employee_by_user[rng.choice(task.user_ids.ids)].id,
+                'date': (now - timedelta(days=rng.randrange(days))).date(),
+                'unit_amount': rng.choice([0.5, 1, 2, 3, 4, 8]),
+            })
+        env['account.analytic.line'].create(line_vals)
+        env.flush_all()
+
+        return {
+            'users': developers,
+            'employees': employees,
+            'projects': project_records,
+            'tasks': task_records,
+            'start_date': now - timedelta(days=days),
+            'end_date': now,
+        }
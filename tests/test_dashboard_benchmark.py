@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+import json
+import logging
+import os
+import statistics
+import time
+import tracemalloc
+
+from odoo import sql_db
+from odoo.tests import HttpCase, tagged
+
+from .common import DashboardDataMixin
+
+_logger = logging.getLogger(__name__)
+
+# Dataset sizes of the benchmark; pick them with DASHBOARD_BENCH_SCALES=small,medium,...
+BENCHMARK_SCALES = {
+    'small': dict(users=10, projects=5, tasks=200, timesheets=2000, bugs=20, days=30),
+    'medium': dict(users=40, projects=25, tasks=2000, timesheets=20000, bugs=200, days=90),
+    'large': dict(users=150, projects=100, tasks=20000, timesheets=200000, bugs=2000, days=365),
+}
+
+
+@tagged('-standard', 'post_install', '-at_install', 'dashboard_benchmark')
+class TestDashboardBenchmark(DashboardDataMixin, HttpCase):
+    """
+    Time every dashboard widget and the /project/dashboard/data route on
+    synthetic datasets. Not part of the standard test run, use::
+
+        odoo-bin -d <db> -i project_dashboard --test-tags dashboard_benchmark
+
+    Environment variables:
+
+    * DASHBOARD_BENCH_SCALES: comma-separated BENCHMARK_SCALES keys (default small,medium)
+    * DASHBOARD_BENCH_ROUNDS: measured runs per widget, the median is reported (default 3)
+    * DASHBOARD_BENCH_SEED: seed of the dataset generator (default 42)
+    * DASHBOARD_BENCH_REPORT: path where the JSON report is written
+    * DASHBOARD_BENCH_BASELINE: path of a previous JSON report to compare against
+    """
+
+    def test_benchmark_dashboard(self):
+        scales = os.environ.get('DASHBOARD_BENCH_SCALES', 'small,medium').split(',')
+        rounds = int(os.environ.get('DASHBOARD_BENCH_ROUNDS', 3))
+        seed = int(os.environ.get('DASHBOARD_BENCH_SEED', 42))
+
+        report = {}
+        for scale in scales:
+            savepoint = self.env.cr.savepoint()
+            try:
+                dataset = self._generate_dashboard_data(self.env, seed=seed, **BENCHMARK_SCALES[scale])
+                report[scale] = self._benchmark_scale(dataset, rounds)
+            finally:
+                savepoint.close(rollback=True)
+                self.env.invalidate_all(flush=False)
+
+        self._emit_report(report)
+
+    def _benchmark_scale(self, dataset, rounds):
+        start_date, end_date = dataset['start_date'], dataset['end_date']
+        widgets = self.env['project_dashboard.data']._get_dashboard_widgets(start_date, end_date)
+        results = {
+            key: self._measure(lambda: compute(self.env), rounds)
+            for key, compute in widgets.items()
+        }
+
+        self.authenticate('admin', 'admin')
+        payload = json.dumps({
+            'jsonrpc': '2.0',
+            'method': 'call',
+            'params': {
+                'start_date': start_date.strftime('%Y-%m-%d'),
+                'end_date': end_date.strftime('%Y-%m-%d'),
+            },
+        })
+
+        def request_dashboard():
+            response = self.url_open('/project/dashboard/data', data=payload,
+                                     headers={'Content-Type': 'application/json'}, timeout=3600)
+            response.raise_for_status()
+            return len(response.content)
+
+        results['get_dashboard_data'] = self._measure(request_dashboard, rounds)
+        return results
+
+    def _measure(self, func, rounds):
+        """Return the median wall time, SQL queries and peak Python memory of ``func``."""
+        samples = []
+        for _i in range(rounds):
+            self.env.invalidate_all()
+            tracemalloc.start()
+            queries = sql_db.sql_counter
+            started = time.perf_counter()
+            result = func()
+            elapsed = time.perf_counter() - started
+            queries = sql_db.sql_counter - queries
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            samples.append({
+                'time_ms': elapsed * 1000,
+                'queries': queries,
+                'peak_kib': peak / 1024,
+                'payload_bytes': result if isinstance(result, int) else len(json.dumps(result, default=str)),
+            })
+        return {
+            metric: round(statistics.median(sample[metric] for sample in samples), 2)
+            for metric in samples[0]
+        }
+
+    def _emit_report(self, report):
+        baseline = {}
+        baseline_path = os.environ.get('DASHBOARD_BENCH_BASELINE')
+        if baseline_path and os.path.exists(baseline_path):
+            with open(baseline_path) as f:
+                baseline = json.load(f)
+
+        lines = [f"{'scale':<8} {'widget':<30} {'time_ms':>10} {'queries':>8} {'peak_kib':>10} {'bytes':>10} {'vs base':>9}"]
+        for scale, results in report.items():
+            for key, metrics in results.items():
+                base = baseline.get(scale, {}).get(key)
+                delta = ''
+                if base and base['time_ms']:
+                    delta = f"{(metrics['time_ms'] - base['time_ms']) / base['time_ms'] * 100:+.0f}%"
+                lines.append(f"{scale:<8} {key:<30} {metrics['time_ms']:>10} {metrics['queries']:>8} "
+                             f"{metrics['peak_kib']:>10} {metrics['payload_bytes']:>10} {delta:>9}")
+        _logger.info("Dashboard benchmark report\n%s", '\n'.join(lines))
+
+        report_path = os.environ.get('DASHBOARD_BENCH_REPORT')
+        if report_path:
+            with open(report_path, 'w') as f:
+                json.dump(report, f, indent=2, sort_keys=True)
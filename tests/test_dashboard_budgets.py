@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+from odoo.tests import TransactionCase, tagged
+
+from odoo.addons.project_dashboard.controllers.controllers import ProjectDashboard
+
+
+def run_queries(count, value):
+    def compute(env):
+        for _i in range(count):
+            env.cr.execute("SELECT 1")
+        return value
+    return compute
+
+
+@tagged('post_install', '-at_install')
+class TestDashboardBudgets(TransactionCase):
+    """A widget running over its budget is served its last result, its coarse variant, or nothing."""
+
+    def setUp(self):
+        super().setUp()
+        self.env['ir.config_parameter'].sudo().set_param('project_dashboard.widget_max_queries.test_widget', '2')
+        self.dashboard = ProjectDashboard()
+        # The last results are kept per worker: isolate the tests from each other
+        self.cache_key = (self._testMethodName,)
+
+    def _get_values(self, compute, coarse_compute=None):
+        return self.dashboard._get_dashboard_values(
+            self.env, {'test_widget': compute}, fallbacks={'test_widget': coarse_compute} if coarse_compute else None,
+            cache_key=self.cache_key)
+
+    def test_within_budget(self):
+        values = self._get_values(run_queries(2, 'fresh'))
+        self.assertEqual(values['test_widget'], 'fresh')
+        self.assertNotIn('degraded_widgets', values)
+
+    def test_coarse_fallback(self):
+        values = self._get_values(run_queries(3, 'fresh'), run_queries(1, 'coarse'))
+        self.assertEqual(values['test_widget'], 'coarse')
+        self.assertEqual(values['degraded_widgets'], {
+            'test_widget': {'reason': 'query_budget', 'fallback': 'coarse'},
+        })
+
+    def test_last_result_fallback(self):
+        self._get_values(run_queries(1, 'previous'))
+        values = self._get_values(run_queries(3, 'fresh'), run_queries(1, 'coarse'))
+        self.assertEqual(values['test_widget'], 'previous')
+        degraded = values['degraded_widgets']['test_widget']
+        self.assertEqual(degraded['fallback'], 'cache')
+        self.assertTrue(degraded['as_of'])
+
+    def test_no_fallback(self):
+        values = self._get_values(run_queries(3, 'fresh'), run_queries(3, 'coarse'))
+        self.assertIsNone(values['test_widget'])
+        self.assertEqual(values['degraded_widgets'], {
+            'test_widget': {'reason': 'query_budget', 'fallback': None},
+        })
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+from datetime import datetime, timedelta
+
+from odoo.tests import TransactionCase, tagged
+
+from odoo.addons.project_dashboard.models.project_task import downsample_series, lttb_indices
+
+
+@tagged('post_install', '-at_install')
+class TestDashboardDownsampling(TransactionCase):
+
+    def test_lttb_keeps_bounds_and_peaks(self):
+        values = [0.0] * 200
+        values[57] = 100.0
+        indices = lttb_indices(values, 20)
+        self.assertEqual(len(indices), 20)
+        self.assertEqual(indices, sorted(indices))
+        self.assertEqual((indices[0], indices[-1]), (0, 199))
+        self.assertIn(57, indices)
+
+    def test_lttb_below_threshold(self):
+        self.assertEqual(lttb_indices([1, 2, 3], 10), [0, 1, 2])
+
+    def test_downsample_series_shares_indices(self):
+        labels = [str(i) for i in range(10)]
+        series = [[1, 1, 1, 1, 9, 1, 1, 1, 1, 1], [0] * 10]
+        labels, (first, second) = downsample_series(labels, series, 4)
+        self.assertEqual(len(labels), 4)
+        self.assertIn('4', labels)
+        self.assertEqual(len(first), 4)
+        self.assertEqual(second, [0] * 4)
+
+    def test_capacity_allocation_max_points(self):
+        Task = self.env['project.task']
+        end_date = datetime(2024, 6, 30)
+        start_date = end_date - timedelta(days=89)
+
+        data = Task._get_capacity_allocation_data(start_date, end_date, 'day')
+        self.assertEqual((data['interval'], len(data['weeks'])), ('day', 90))
+
+        data = Task._get_capacity_allocation_data(start_date, end_date, 'day', max_points=20)
+        self.assertEqual(data['interval'], 'week')
+        self.assertLessEqual(len(data['weeks']), 20)
+
+        data = Task._get_capacity_allocation_data(start_date - timedelta(days=730), end_date, 'day', max_points=10)
+        self.assertEqual((data['interval'], len(data['weeks'])), ('month', 10))
+        for row in data['data']:
+            self.assertEqual(len(row), 10)
+
+    def test_reversed_range(self):
+        Task = self.env['project.task']
+        start_date, end_date = datetime(2024, 6, 30), datetime(2024, 6, 1)
+        self.assertEqual(
+            self.env['project_dashboard.data']._parse_date_range('2024-06-30', '2024-06-01'),
+            (end_date, start_date))
+
+        self.assertEqual(Task._get_dashboard_buckets(start_date, end_date, 'auto'),
+                         Task._get_dashboard_buckets(end_date, start_date, 'auto'))
+        for widget in ('_get_bug_resolution_data', '_get_capacity_allocation_data', '_get_weekly_burn_rate_data'):
+            data = getattr(Task, widget)(start_date, end_date, 'week')
+            self.assertEqual(data['interval'], 'week')
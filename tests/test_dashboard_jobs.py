@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+import json
+
+from odoo.exceptions import AccessError
+from odoo.tests import TransactionCase, tagged
+
+from .common import DashboardDataMixin
+
+
+@tagged('post_install', '-at_install')
+class TestDashboardJobs(DashboardDataMixin, TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.data = cls._generate_dashboard_data(cls.env, users=2, tasks=20, timesheets=40, bugs=4, days=30)
+
+    def _create_job(self, user, **params):
+        # As submit_dashboard_job
+        return self.env['project_dashboard.job'].sudo().create({
+            'user_id': user.id,
+            'parameters': json.dumps(dict({
+                'start_date': f"{self.data['start_date']:%Y-%m-%d}",
+                'end_date': f"{self.data['end_date']:%Y-%m-%d}",
+                'limit': None,
+                'offset': 0,
+                'widgets': None,
+                'max_points': None,
+                'interval': 'week',
+            }, **params)),
+        })
+
+    def test_run_job(self):
+        job = self._create_job(self.data['users'][0], widgets=['summary', 'bug_resolution'])
+        self.assertEqual(job.state, 'pending')
+        result = job._run_job()
+        self.assertEqual(set(result), {'summary', 'bug_resolution', 'data_source'})
+        self.assertEqual(result['bug_resolution']['interval'], 'week')
+
+    def test_jobs_of_other_users(self):
+        first_user, second_user = self.data['users'][:2]
+        job = self._create_job(first_user)
+        with self.assertRaises(AccessError):
+            job.with_user(second_user).read(['state'])
+
+    def test_jobs_not_created_by_users(self):
+        with self.assertRaises(AccessError):
+            self.env['project_dashboard.job'].with_user(self.data['users'][0]).create({
+                'state': 'done',
+                'parameters': '{}',
+                'result': '{}',
+            })
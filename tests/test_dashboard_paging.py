@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+from datetime import datetime
+
+from odoo import Command
+from odoo.exceptions import UserError
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestDashboardPaging(TransactionCase):
+    """The paged widgets return one page of the ranking, the rest merged in "Other", and totals over all rows."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Only the records of the test are ranked
+        cls.env['project.task'].search([]).write({'active': False})
+
+        group_ids = [cls.env.ref('base.group_user').id, cls.env.ref('hr_timesheet.group_hr_timesheet_user').id]
+        cls.first_user, cls.second_user = cls.env['res.users'].with_context(no_reset_password=True).create([{
+            'name': f'Paging Developer {i}',
+            'login': f'dashboard_paging_dev_{i}',
+            'groups_id': [Command.set(group_ids)],
+        } for i in (1, 2)])
+        cls.employee = cls.env['hr.employee'].create({'name': cls.first_user.name, 'user_id': cls.first_user.id})
+
+        todo, done = cls.env['project.task.type'].create([
+            {'name': 'Paging To Do', 'sequence': 0},
+            {'name': 'Paging Done', 'sequence': 10, 'fold': True},
+        ])
+        cls.projects = cls.env['project.project'].create([{
+            'name': f'Paging Project {name}',
+            'type_ids': [Command.set([todo.id, done.id])],
+            'allow_timesheets': True,
+        } for name in 'ABCD'])
+        project_a, project_b, project_c, project_d = cls.projects
+
+        def task(project, stage, users=(), planned_hours=0, logged_hours=0):
+            record = cls.env['project.task'].create({
+                'name': f'{project.name} task',
+                'project_id': project.id,
+                'stage_id': stage.id,
+                'user_ids': [Command.set([user.id for user in users])],
+                'planned_hours': planned_hours,
+            })
+            if logged_hours:
+                cls.env['account.analytic.line'].create({
+                    'name': '/',
+                    'project_id': project.id,
+                    'task_id': record.id,
+                    'employee_id': cls.employee.id,
+                    'unit_amount': logged_hours,
+                })
+            return record
+
+        # Project progress: A 1/4 done, B 3/3, C 0/2, D 1/1
+        # Overruns: (first user, A) 2 tasks 4h, (first user, B) 1 task 3h,
+        # (second user, A) 1 task 2h, (unassigned, C) 1 task 2h
+        task(project_a, todo, [cls.first_user], planned_hours=2, logged_hours=5)
+        task(project_a, todo, [cls.first_user], planned_hours=1, logged_hours=2)
+        task(project_a, todo, [cls.second_user], planned_hours=4, logged_hours=6)
+        task(project_a, done, [cls.second_user], planned_hours=4, logged_hours=1)
+        task(project_b, done, [cls.first_user], planned_hours=1, logged_hours=4)
+        task(project_b, done)
+        task(project_b, done)
+        task(project_c, todo, planned_hours=0, logged_hours=2)
+        task(project_c, todo)
+        task(project_d, done)
+        cls.env.flush_all()
+
+    def test_project_progress_first_page(self):
+        data = self.env['project.task']._get_project_progress_data(limit=2)
+        self.assertEqual(data['labels'], ['Paging Project A', 'Paging Project B', 'Other'])
+        self.assertEqual(data['total_tasks'], [4, 3, 3])
+        self.assertEqual(data['completed'], [1, 3, 1])
+        self.assertEqual(data['remaining'], [3, 0, 2])
+        self.assertEqual(data['percentages'], [25, 100, 33])
+        self.assertEqual((data['offset'], data['limit'], data['total_count']), (0, 2, 4))
+
+    def test_project_progress_pages(self):
+        Task = self.env['project.task']
+        data = Task._get_project_progress_data(limit=2, offset=1)
+        self.assertEqual(data['labels'], ['Paging Project B', 'Paging Project C', 'Other'])
+        self.assertEqual(data['total_tasks'], [3, 2, 1])
+
+        data = Task._get_project_progress_data(limit=2, offset=2)
+        self.assertEqual(data['labels'], ['Paging Project C', 'Paging Project D'])
+        self.assertEqual(data['completed'], [0, 1])
+        self.assertEqual(data['total_count'], 4)
+
+        data = Task._get_project_progress_data(limit=2, offset=4)
+        self.assertEqual(data['labels'], [])
+        self.assertEqual(data['total_count'], 4)
+
+    def test_task_overruns_first_page(self):
+        result = self.env['project.task']._get_task_overruns_data(limit=2)
+        first_user = self.first_user.name
+        self.assertEqual(result['data']['labels'], [
+            f'{first_user} (Paging Project A)', f'{first_user} (Paging Project B)', 'Other',
+        ])
+        counts, percentages = (dataset['data'] for dataset in result['data']['datasets'])
+        self.assertEqual(counts, [2, 1, 2])
+        self.assertEqual(percentages, [40.0, 20.0, 40.0])
+        self.assertEqual((result['offset'], result['limit'], result['total_count']), (0, 2, 4))
+        # The summary covers every pair, whatever the page
+        self.assertEqual(result['summary'], {
+            'total_overrun_tasks': 4,
+            'total_overrun_hours': 11.0,
+            'avg_overrun_percentage': 220.0,
+        })
+
+    def test_task_overruns_last_page(self):
+        result = self.env['project.task']._get_task_overruns_data(limit=2, offset=2)
+        self.assertEqual(result['data']['labels'], [f'{self.second_user.name} (Paging Project A)', 'Paging Project C'])
+        self.assertEqual(result['data']['datasets'][0]['data'], [1, 1])
+        self.assertEqual(result['summary']['total_overrun_hours'], 11.0)
+
+    def test_invalid_paging_options(self):
+        Dashboard = self.env['project_dashboard.data']
+        start_date, end_date = datetime(2024, 6, 1), datetime(2024, 6, 30)
+        self.assertEqual(Dashboard._parse_dashboard_options(start_date, end_date, '2', '-3', '1', 'week'),
+                         (2, 0, 3, 'week'))
+        for options in ({'limit': 'ten'}, {'offset': '1.5'}, {'max_points': [120]}):
+            with self.assertRaises(UserError):
+                Dashboard._parse_dashboard_options(start_date, end_date, **options)
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+import json
+
+from odoo import sql_db
+from odoo.tests import HttpCase, tagged
+
+from odoo.addons.project_dashboard.models.dashboard_context import DashboardContext
+
+from .common import DashboardDataMixin
+
+# Upper bound of the SQL queries issued by each widget (with warm registry caches),
+# on a dashboard context of its own, i.e. loading the users, employees, stages or
+# projects it uses. The actual count must also be the same at both dataset sizes.
+WIDGET_QUERY_COUNTS = {
+    'summary': 12,
+    'weekly_developer_utilization': 12,
+    'task_distribution': 13,
+    'bug_resolution': 4,
+    'capacity_allocation': 11,
+    'recent_projects': 8,
+    'task_completion': 11,
+    'project_progress': 6,
+    'timesheet_compliance': 8,
+    'task_overruns': 11,
+    'weekly_burn_rate': 11,
+    'task_backlog': 7,
+}
+# Upper bound of the queries of the data route on top of those of its widgets
+# (authentication, dispatch), with warm caches
+ROUTE_QUERY_OVERHEAD = 10
+
+SMALL_DATASET = dict(users=3, projects=2, tasks=30, timesheets=100, bugs=5, days=21)
+LARGE_DATASET = dict(users=12, projects=8, tasks=150, timesheets=400, bugs=20, days=90)
+
+
+@tagged('post_install', '-at_install')
+class TestDashboardQueryCounts(DashboardDataMixin, HttpCase):
+    """The number of queries of the dashboard must not grow with the users, days or projects."""
+
+    def _with_dataset(self, size, func):
+        savepoint = self.env.cr.savepoint()
+        try:
+            dataset = self._generate_dashboard_data(self.env, **size)
+            return func(dataset)
+        finally:
+            savepoint.close(rollback=True)
+            self.env.invalidate_all(flush=False)
+
+    def _count_queries(self, func):
+        self.env.invalidate_all()
+        queries = self.env.cr.sql_log_count
+        func()
+        return self.env.cr.sql_log_count - queries
+
+    def _widget_query_counts(self, dataset):
+        Dashboard = self.env['project_dashboard.data']
+        args = (dataset['start_date'], dataset['end_date'])
+        counts = {}
+        for key, compute in Dashboard._get_dashboard_widgets(*args).items():
+            compute(self.env)  # warm up the registry caches (record rules, groups, ...)
+            # A new dashboard context, so that the count does not depend on the widgets measured before
+            compute = Dashboard._get_dashboard_widgets(*args, dashboard_context=DashboardContext())[key]
+            counts[key] = self._count_queries(lambda: compute(self.env))
+        return counts
+
+    def _widgets_query_count(self, env, dataset):
+        """Queries of all the widgets sharing one dashboard context, as in the data route."""
+        Dashboard = env['project_dashboard.data']
+        args = (dataset['start_date'], dataset['end_date'])
+        for compute in Dashboard._get_dashboard_widgets(*args).values():
+            compute(env)
+        widgets = Dashboard._get_dashboard_widgets(*args, dashboard_context=DashboardContext())
+        return self._count_queries(lambda: [compute(env) for compute in widgets.values()])
+
+    def _route_query_count(self, dataset):
+        payload = json.dumps({
+            'jsonrpc': '2.0',
+            'method': 'call',
+            'params': {
+                'start_date': dataset['start_date'].strftime('%Y-%m-%d'),
+                'end_date': dataset['end_date'].strftime('%Y-%m-%d'),
+            },
+        })
+
+        def request_dashboard():
+            response = self.url_open('/project/dashboard/data', data=payload,
+                                     headers={'Content-Type': 'application/json'})
+            response.raise_for_status()
+            self.assertNotIn('error', response.json())
+
+        request_dashboard()
+        queries = sql_db.sql_counter
+        request_dashboard()
+        return sql_db.sql_counter - queries
+
+    def test_widget_query_counts(self):
+        small = self._with_dataset(SMALL_DATASET, self._widget_query_counts)
+        large = self._with_dataset(LARGE_DATASET, self._widget_query_counts)
+
+        self.assertEqual(set(small), set(WIDGET_QUERY_COUNTS), "Every widget must have a pinned query count")
+        for key, pinned in WIDGET_QUERY_COUNTS.items():
+            self.assertEqual(small[key], large[key],
+                             f"The queries of {key} depend on the dataset size ({small[key]} vs {large[key]})")
+            self.assertLessEqual(large[key], pinned, f"{key} issues more queries than pinned")
+
+    def test_route_query_count(self):
+        self.authenticate('admin', 'admin')
+        env = self.env(user=self.env.ref('base.user_admin'), su=False)
+
+        def count_queries(dataset):
+            return self._route_query_count(dataset), self._widgets_query_count(env, dataset)
+
+        (small, small_widgets), (large, large_widgets) = (
+            self._with_dataset(SMALL_DATASET, count_queries), self._with_dataset(LARGE_DATASET, count_queries))
+        self.assertEqual(small, large, f"The queries of the dashboard route depend on the dataset size ({small} vs {large})")
+        self.assertEqual(small_widgets, large_widgets)
+        self.assertLessEqual(large - large_widgets, ROUTE_QUERY_OVERHEAD,
+                             f"The dashboard route issues {large - large_widgets} queries on top of its widgets")
+        self.assertLessEqual(large, sum(WIDGET_QUERY_COUNTS.values()) + ROUTE_QUERY_OVERHEAD)
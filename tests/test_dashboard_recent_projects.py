@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+from datetime import datetime, timedelta
+
+from odoo import Command, fields
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestDashboardRecentProjects(TransactionCase):
+    """The grouped query of the recent projects matches the statistics of project.task_ids."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env['ir.config_parameter'].sudo().set_param('project_dashboard.recent_projects_count', '1000')
+        user = cls.env['res.users'].with_context(no_reset_password=True).create({
+            'name': 'Recent Projects Developer',
+            'login': 'dashboard_recent_projects_dev',
+            'groups_id': [Command.set([cls.env.ref('base.group_user').id,
+                                       cls.env.ref('hr_timesheet.group_hr_timesheet_user').id])],
+        })
+        cls.employee = cls.env['hr.employee'].create({'name': user.name, 'user_id': user.id})
+        cls.todo, cls.done = cls.env['project.task.type'].create([
+            {'name': 'Recent To Do', 'sequence': 0},
+            {'name': 'Recent Done', 'sequence': 10, 'fold': True},
+        ])
+        cls.projects = cls.env['project.project'].create([{
+            'name': f'Recent Project {name}',
+            'type_ids': [Command.set([cls.todo.id, cls.done.id])],
+            'allow_timesheets': True,
+        } for name in ('Delayed', 'In Progress', 'Completed', 'Draft')])
+        delayed, in_progress, completed, _draft = cls.projects
+
+        today = fields.Date.today()
+        end = datetime.combine(today, datetime.min.time()) + timedelta(hours=12)
+        cls._create_task(delayed, cls.todo, deadline=today - timedelta(days=2), end=end, hours=3)
+        cls._create_task(delayed, cls.todo, hours=1.5)  # no deadline
+        cls._create_task(delayed, cls.done, deadline=today, end=end - timedelta(days=1), hours=2)
+        cls._create_task(delayed, cls.todo, deadline=today - timedelta(days=5), end=end, hours=4, active=False)
+        cls._create_task(in_progress, cls.todo, deadline=today + timedelta(days=5), end=end, hours=2.25)
+        cls._create_task(in_progress, cls.todo)
+        cls._create_task(in_progress, cls.done, hours=1)
+        cls._create_task(completed, cls.done, deadline=today - timedelta(days=1), end=end, hours=1)
+        cls._create_task(completed, cls.done, active=False)
+        cls.env.flush_all()
+
+    @classmethod
+    def _create_task(cls, project, stage, deadline=None, end=None, hours=0, active=True):
+        task = cls.env['project.task'].create({
+            'name': f'{project.name} task',
+            'project_id': project.id,
+            'stage_id': stage.id,
+            'date_deadline': deadline,
+            'task_end_date': end,
+        })
+        if hours:
+            cls.env['account.analytic.line'].create({
+                'name': '/',
+                'project_id': project.id,
+                'task_id': task.id,
+                'employee_id': cls.employee.id,
+                'unit_amount': hours,
+            })
+        task.active = active
+        return task
+
+    def _get_task_ids_stats(self, project):
+        """The statistics as computed from project.task_ids before the grouped query."""
+        tasks = project.task_ids
+        if not tasks:
+            status = 'draft'
+        elif all(task.stage_id.fold for task in tasks):
+            status = 'completed'
+        elif any(task.is_overdue for task in tasks):
+            status = 'delayed'
+        else:
+            status = 'in_progress'
+        completed = len(tasks.filtered(lambda task: task.stage_id.fold))
+        return {
+            'progress': round((completed / len(tasks)) * 100, 2) if tasks else 0,
+            'tasks': len(tasks),
+            'hours': round(sum(tasks.mapped('effective_hours') or [0]), 2),
+            'status': status,
+        }
+
+    def test_recent_projects_match_task_ids(self):
+        rows = {row['name']: row for row in self.env['project_dashboard.data']._get_recent_projects()}
+        for project in self.projects:
+            row = rows[project.name]
+            self.assertEqual(
+                {key: row[key] for key in ('progress', 'tasks', 'hours', 'status')},
+                self._get_task_ids_stats(project), project.name)
+            self.assertEqual(row['status_class'],
+                             self.env['project_dashboard.data']._get_status_class(row['status']))
+
+        self.assertEqual([rows[project.name]['status'] for project in self.projects],
+                         ['delayed', 'in_progress', 'completed', 'draft'])
+        # The archived tasks are not counted
+        self.assertEqual(rows['Recent Project Delayed']['tasks'], 3)
+        self.assertEqual(rows['Recent Project Delayed']['hours'], 6.5)
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+
+from odoo.exceptions import AccessError
+from odoo.tests import TransactionCase, tagged
+
+from .common import DashboardDataMixin
+
+
+@tagged('post_install', '-at_install')
+class TestDashboardRollups(DashboardDataMixin, TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.data = cls._generate_dashboard_data(cls.env, days=120)
+
+    def _get_monthly_widgets(self, user=None):
+        Task = self.env['project.task'].with_user(user) if user else self.env['project.task']
+        start_date, end_date = self.data['start_date'], self.data['end_date']
+        return {
+            'bug_resolution': Task._get_bug_resolution_data(start_date, end_date, 'month'),
+            'capacity_allocation': Task._get_capacity_allocation_data(start_date, end_date, 'month'),
+            'weekly_burn_rate': Task._get_weekly_burn_rate_data(start_date, end_date, 'month'),
+            'task_completion': Task._get_task_completion_data(start_date, end_date),
+            'weekly_developer_utilization': Task._get_weekly_developer_utilization(start_date, end_date),
+        }
+
+    def _get_live_widgets(self, user=None):
+        ICP = self.env['ir.config_parameter'].sudo()
+        rolled_up_until = ICP.get_param('project_dashboard.rollup_until')
+        ICP.set_param('project_dashboard.rollup_until', False)
+        try:
+            return self._get_monthly_widgets(user)
+        finally:
+            ICP.set_param('project_dashboard.rollup_until', rolled_up_until)
+
+    def assertSameSeries(self, first, second):
+        self.assertEqual(len(first), len(second))
+        for first_value, second_value in zip(first, second):
+            self.assertAlmostEqual(first_value, second_value, delta=0.011)
+
+    def assertSameWidgets(self, live, rolled_up):
+        for key in ('bug_resolution', 'weekly_burn_rate', 'task_completion', 'weekly_developer_utilization'):
+            self.assertEqual(live[key]['labels'], rolled_up[key]['labels'], key)
+            for live_dataset, rolled_up_dataset in zip(live[key]['datasets'], rolled_up[key]['datasets']):
+                self.assertSameSeries(live_dataset['data'], rolled_up_dataset['data'])
+        self.assertEqual(live['capacity_allocation']['weeks'], rolled_up['capacity_allocation']['weeks'])
+        for live_row, rolled_up_row in zip(live['capacity_allocation']['data'],
+                                           rolled_up['capacity_allocation']['data']):
+            self.assertSameSeries(live_row, rolled_up_row)
+
+    def test_rollups_match_live_data(self):
+        Rollup = self.env['project_dashboard.monthly_rollup']
+        live = self._get_monthly_widgets()
+
+        Rollup._cron_rollup_closed_months()
+        span = Rollup._get_span(self.data['start_date'], self.data['end_date'])
+        self.assertTrue(span, "The range covers at least two closed months")
+        self.assertTrue(Rollup.search_count([('month', '>=', span[0].date())]))
+        self.assertSameWidgets(live, self._get_monthly_widgets())
+
+    def test_rollups_follow_changes_of_closed_months(self):
+        Rollup = self.env['project_dashboard.monthly_rollup']
+        Rollup._cron_rollup_closed_months()
+        span = Rollup._get_span(self.data['start_date'], self.data['end_date'])
+        closed_tasks = self.data['tasks'].filtered(lambda task: span[0] <= task.task_start_date < span[1])
+        self.assertGreaterEqual(len(closed_tasks), 2)
+
+        # Estimate edited and task archived after their month is rolled up
+        closed_tasks[0].planned_hours += 10
+        closed_tasks[1].active = False
+        # Lines without project are neither rolled up nor counted live
+        project = self.data['projects'][0]
+        self.env['account.analytic.line'].create({
+            'name': '/',
+            'account_id': project.analytic_account_id.id,
+            'employee_id': self.data['employees'][0].id,
+            'date': span[0].date() + timedelta(days=3),
+            'unit_amount': 7,
+        })
+
+        Rollup._cron_rollup_closed_months()
+        self.assertSameWidgets(self._get_live_widgets(), self._get_monthly_widgets())
+
+    def test_rollup_again_replaces_months(self):
+        Rollup = self.env['project_dashboard.monthly_rollup']
+        Rollup._cron_rollup_closed_months()
+        count = Rollup.search_count([])
+        Rollup._cron_rollup_closed_months()
+        self.assertEqual(Rollup.search_count([]), count)
+
+    def test_rollups_not_readable_by_users(self):
+        self.env['project_dashboard.monthly_rollup']._cron_rollup_closed_months()
+        user = self.data['users'][0]
+        with self.assertRaises(AccessError):
+            self.env['project_dashboard.monthly_rollup'].with_user(user).search_read([], ['timesheet_hours'])
+
+    def test_rollups_follow_record_rules(self):
+        Rollup = self.env['project_dashboard.monthly_rollup']
+        Rollup._cron_rollup_closed_months()
+        self.assertTrue(Rollup._get_span(self.data['start_date'], self.data['end_date']))
+
+        # A timesheet user only reads their own timesheets: the closed months
+        # are computed from the records, as the rest of the range
+        user = self.data['users'][0]
+        self.assertFalse(Rollup.with_user(user)._get_span(self.data['start_date'], self.data['end_date']))
+        rolled_up = self._get_monthly_widgets(user)
+        self.assertSameWidgets(self._get_live_widgets(user), rolled_up)
+
+        def logged_hours(widgets):
+            utilization = widgets['weekly_developer_utilization']
+            hours = dict(zip(utilization['labels'], utilization['datasets'][1]['data']))
+            return {developer.name: hours[developer.name] for developer in self.data['users']}
+
+        # The user's own hours only, where the rollups hold those of everyone
+        own_hours, all_hours = logged_hours(rolled_up), logged_hours(self._get_monthly_widgets())
+        self.assertTrue(own_hours.pop(user.name))
+        self.assertEqual(all_hours.pop(user.name), logged_hours(rolled_up)[user.name])
+        self.assertFalse(any(own_hours.values()))
+        self.assertTrue(any(all_hours.values()))